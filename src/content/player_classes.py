@@ -1,6 +1,8 @@
 from __future__ import annotations
 """Banque de classes joueur (contenu)."""
 
+from types import MappingProxyType
+
 from core.player_class import PlayerClass
 from core.stats import Stats
 from core.attack import Attack
@@ -8,7 +10,7 @@ from core.equipment_set import EquipmentSet
 from core.equipment import Weapon, Armor, Artifact
 
 
-CLASSES: dict[str, PlayerClass] = {
+_CLASSES: dict[str, PlayerClass] = {
     "guerrier": PlayerClass(
         name="Guerrier",
         bonus_stats=Stats(attack=25, defense=10),
@@ -95,4 +97,7 @@ CLASSES: dict[str, PlayerClass] = {
             Artifact(name="Amulette émoussée", durability_max=100, atk_pct=0.05, def_pct=0.05, lck_pct=0.05, description="Une lourde amulette imbue de piété")
         )
     ),
-}
\ No newline at end of file
+}
+
+# registre figé en lecture seule (la banque n'est jamais modifiée à l'exécution)
+CLASSES: MappingProxyType[str, PlayerClass] = MappingProxyType(_CLASSES)
@@ -10,7 +10,9 @@ if TYPE_CHECKING:
 
 
 class EnemyBehavior(Protocol):
-    def choose(self, *, enemy, player, attacks: Sequence[Attack], rng) -> Attack: ...
+    def choose(self, *, enemy, player, attacks: Sequence[Attack], rng) -> Attack:
+        """Retourne l'attaque choisie. `attacks` est la liste vivante de l'ennemi: lecture seule, ne pas la muter."""
+        ...
 
 class Aggressive:
     def choose(self, *, enemy: Enemy, player: Player, attacks: Sequence[Attack], rng: Random):
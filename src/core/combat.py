@@ -11,13 +11,12 @@ if TYPE_CHECKING:
     from core.entity import Entity
     from core.equipment import Weapon, Armor
     from core.equipment_set import EquipmentSet
-    from core.effects import StatPercentMod
     from core.player import Player
     from core.enemy import Enemy
 
 # ---- Protocols facultatifs (pour aider le typage sans import circulaire) ----
 
-@dataclass
+@dataclass(slots=True)
 class CombatEvent:
     """Un message d'événement + tag et data optionnelles pour l'UI."""
     text: str
@@ -43,6 +42,12 @@ class CombatContext:
     damage_dealt: int = 0
     was_crit: bool = False
 
+    def emit(self, text: str, tag: str | None = None, data: dict[str, Any] | None = None) -> CombatEvent:
+        """Crée et ajoute un évènement au flux du tour."""
+        ev = CombatEvent(text, tag, data)
+        self.events.append(ev)
+        return ev
+
 # ---- Moteur ----
 
 class CombatEngine:
@@ -114,7 +119,7 @@ class CombatEngine:
             raw = int(round(raw * self._crit_multiplier(attacker, attack)))
 
         # 4) Application des dégâts
-        dealt = defender.take_damage(raw)
+        dealt = defender._take_damage_fast(raw)   # raw: int >= 1 (cf. max(1, ...) plus haut)
         ctx.damage_dealt = dealt
         ctx.was_crit = was_crit
 
@@ -149,19 +154,14 @@ class CombatEngine:
     def _effective_attack(self, entity: Entity) -> int:
         """Attack effective = plats (déjà dans base_stats) * (1 + somme %)."""
         base = int(entity.base_stats.attack)
-        pct = self._gather_pct(entity, which="attack")
+        pct = entity.equipment.artifact.stat_percent_mod().attack_pct
         return int(round(base * (1.0 + pct)))
 
     def _effective_defense(self, entity: Entity) -> int:
         base = int(entity.base_stats.defense)
-        pct = self._gather_pct(entity, which="defense")
+        pct = entity.equipment.artifact.stat_percent_mod().defense_pct
         return int(round(base * (1.0 + pct)))
 
-    def _gather_pct(self, entity: Player, which: str) -> float:
-        art = entity.equipment.artifact
-        mod : StatPercentMod = art.stat_percent_mod()
-        return float(getattr(mod, f"{which}_pct", 0.0))
-    
     def estimate_damage(self, attacker, defender, attack: Attack) -> tuple[int, int]:
         if getattr(attack, "deals_damage", True) is False:
             return (0, 0)
@@ -208,19 +208,25 @@ class CombatEngine:
     def _wear_after_attack(self, attacker: Player | Enemy, ctx: CombatContext, events: list[CombatEvent]) -> None:
         if getattr(attacker, "equipment", None):
             atk_weapon: Weapon = attacker.equipment.weapon
+            if atk_weapon.unbreakable:
+                return
             if hasattr(atk_weapon, "on_after_attack"):
-                was_broken = getattr(atk_weapon, "is_broken", lambda: False)()
+                dur = atk_weapon.durability
+                was_broken = dur.current <= 0
                 atk_weapon.on_after_attack(ctx)
-                now_broken = getattr(atk_weapon, "is_broken", lambda: False)()
+                now_broken = dur.current <= 0
                 if not was_broken and now_broken:
                     events.append(CombatEvent(text=f"L'arme de {attacker.name} se casse !", tag="weapon_broken"))
 
     def _wear_after_hit(self, defender: Player | Enemy, ctx: CombatContext, events: list[CombatEvent]) -> None:
         if getattr(defender, "equipment", None):
             def_armor: Armor = defender.equipment.armor
+            if def_armor.unbreakable:
+                return
             if hasattr(def_armor, "on_after_hit"):
-                was_broken = getattr(def_armor, "is_broken", lambda: False)()
+                dur = def_armor.durability
+                was_broken = dur.current <= 0
                 def_armor.on_after_hit(ctx, damage_taken=ctx.damage_dealt)
-                now_broken = getattr(def_armor, "is_broken", lambda: False)()
+                now_broken = dur.current <= 0
                 if not was_broken and now_broken:
                     events.append(CombatEvent(text=f"L'armure de {defender.name} se brise !", tag="armor_broken"))
\ No newline at end of file
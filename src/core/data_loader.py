@@ -17,16 +17,24 @@ Fichiers attendus (dans src/data/ ou mods/env):
 """
 
 from dataclasses import dataclass
-from typing import Any, Callable, TYPE_CHECKING, Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, TYPE_CHECKING, Dict, List
 import json
+import sys
 from pathlib import Path
 from copy import deepcopy
 import random
 
+try:  # parseur JSON plus rapide si disponible (API compatible pour loads)
+    import orjson as _json
+except ImportError:
+    _json = json
+
 from core.data_paths import default_data_dirs
 from core.attack import Attack
 from core.loadout import Loadout
-from core.item import Consumable, Slot
+from core.item import Consumable, Slot, get_item, forget_item
 from core.stats import Stats
 from core.player_class import PlayerClass
 from core.effects_bank import make_effect
@@ -44,13 +52,27 @@ if TYPE_CHECKING:
 
 # ---------- Helpers JSON ----------
 
+@lru_cache(maxsize=512)
+def _load_json_cached(path_str: str, mtime_ns: int) -> Any:
+    # mtime_ns fait partie de la clé: un fichier modifié est relu automatiquement
+    return _json.loads(Path(path_str).read_bytes())
+
+
+def read_json_cached(path: Path) -> Any:
+    """Parse un fichier JSON en mémoïsant le résultat tant que le fichier n'a pas changé.
+
+    Le résultat est partagé entre appelants: le traiter en lecture seule (copier avant de muter).
+    """
+    return _load_json_cached(str(path), path.stat().st_mtime_ns)
+
+
 def _read_json_first(path_rel: str) -> Any | None:
     """Lit le premier JSON trouvé pour path_rel depuis la liste de répertoires de données."""
     for base in default_data_dirs():
         p = base / Path(path_rel)
         if p.exists():
             try:
-                return json.loads(p.read_text(encoding="utf-8"))
+                return read_json_cached(p)
             except Exception:
                 continue
     return None
@@ -95,6 +117,10 @@ def _flatten_effects(effs: Any) -> List:
 
 # ---------- Player classes ----------
 
+# ligne JSON absente: mapping vide partagé (lecture seule), sans allouer de {} par .get()
+_EMPTY_ROW: Mapping[str, Any] = MappingProxyType({})
+
+
 def load_player_classes(merge_into: dict[str, PlayerClass] | None = None) -> dict[str, PlayerClass]:
     """Charge player_classes.json et retourne/merge un registre {key: PlayerClass}."""
     raw = _read_json_first("player_classes.json")
@@ -103,7 +129,7 @@ def load_player_classes(merge_into: dict[str, PlayerClass] | None = None) -> dic
 
     result: dict[str, PlayerClass] = {} if merge_into is None else merge_into
     for key, row in raw.items():
-        key = (str(key) or "").strip().lower()
+        key = sys.intern((str(key) or "").strip().lower())
         name = row.get("name", key)
         bonus: dict = row.get("bonus_stats", {})
         bonus_stats = Stats(
@@ -115,26 +141,29 @@ def load_player_classes(merge_into: dict[str, PlayerClass] | None = None) -> dic
         bonus_sp = int(row.get("bonus_sp_max", 0))
 
         # équipement de base (optionnel)
-        base_equip: dict[str, dict] = row.get("base_equip", {})
+        base_equip: dict[str, dict] = row.get("base_equip", _EMPTY_ROW)
+        w = base_equip.get("weapon", _EMPTY_ROW)
+        a = base_equip.get("armor", _EMPTY_ROW)
+        r = base_equip.get("artifact", _EMPTY_ROW)
         base_weapon = Weapon(
-            name=base_equip.get("weapon", {}).get("name", "Arme"),
-            durability_max=base_equip.get("weapon", {}).get("durability_max", 0),
-            bonus_attack=base_equip.get("weapon", {}).get("bonus_attack", 0),
-            description=base_equip.get("weapon", {}).get("description", "")
+            name=w.get("name", "Arme"),
+            durability_max=w.get("durability_max", 0),
+            bonus_attack=w.get("bonus_attack", 0),
+            description=w.get("description", "")
         )
         base_armor = Armor(
-            name=base_equip.get("armor", {}).get("name", "Armure"),
-            durability_max=base_equip.get("armor", {}).get("durability_max", 0),
-            bonus_defense=base_equip.get("armor", {}).get("bonus_defense", 0),
-            description=base_equip.get("armor", {}).get("description", "")
+            name=a.get("name", "Armure"),
+            durability_max=a.get("durability_max", 0),
+            bonus_defense=a.get("bonus_defense", 0),
+            description=a.get("description", "")
         )
         base_artifact = Artifact(
-            name=base_equip.get("artifact", {}).get("name", "Artéfact"),
-            durability_max=base_equip.get("artifact", {}).get("durability_max", 0),
-            atk_pct=base_equip.get("artifact", {}).get("atk_pct", 0.0),
-            def_pct=base_equip.get("artifact", {}).get("def_pct", 0.0),
-            lck_pct=base_equip.get("artifact", {}).get("lck_pct", 0.0),
-            description=base_equip.get("artifact", {}).get("description", "")
+            name=r.get("name", "Artéfact"),
+            durability_max=r.get("durability_max", 0),
+            atk_pct=r.get("atk_pct", 0.0),
+            def_pct=r.get("def_pct", 0.0),
+            lck_pct=r.get("lck_pct", 0.0),
+            description=r.get("description", "")
         )
         class_base_equip = EquipmentSet(
             weapon=base_weapon,
@@ -269,99 +298,112 @@ class DataConsumable(Consumable):
         self._payload = dict(payload or {})
 
     def on_use(self, user: Player, ctx=None):
-        t = self._payload.get("type")
-        evs: list[CombatEvent] = []
+        p = self._payload
+        handler = _USE_HANDLERS.get(p.get("type"))
+        if handler is None:
+            return super().on_use(user, ctx)
         gm = getattr(ctx, "effect_manager", None) if ctx else None
-        rng = getattr(getattr(ctx, "engine", None), "rng", None) if ctx else None
         if gm is None and ctx is not None:
             gm = getattr(ctx, "effects", None)
+        evs: list[CombatEvent] = []
+        handler(self, p, user, ctx, gm, evs)
+        return evs
 
-        if t == "heal_hp":
-            amt = int(self._payload.get("amount", 0))
-            healed = user.heal_hp(amt)
-            evs.append(CombatEvent(text=f"{user.name} récupère {healed} PV.", tag="use_heal_hp", data={"amount": healed}))
+    # --- handlers par type d'usage: (self, payload, user, ctx, gm, evs) ---
 
-        elif t == "heal_sp":
-            amt = int(self._payload.get("amount", 0))
-            restored = user.heal_sp(amt)
-            evs.append(CombatEvent(text=f"{user.name} récupère {restored} SP.", tag="use_heal_sp", data={"amount": restored}))
+    def _use_heal_hp(self, p: dict, user: Player, ctx, gm, evs: list[CombatEvent]) -> None:
+        amt = int(p.get("amount", 0))
+        healed = user.heal_hp(amt)
+        evs.append(CombatEvent(text=f"{user.name} récupère {healed} PV.", tag="use_heal_hp", data={"amount": healed}))
 
-        elif t == "cure_poison":
-            try:
-                if isinstance(gm, EffectManager):
-                    removed = gm.purge(user, cls_name="PoisonEffect")
-                else:
-                    removed = 0
-                if removed:
-                    evs.append(CombatEvent(text=f"{user.name} est purgé du poison.", tag="use_cure_poison"))
-                else:
-                    evs.append(CombatEvent(text="Aucun poison à purger.", tag="use_cure_poison_none"))
-            except Exception:
-                evs.append(CombatEvent(text="L’antidote n’a eu aucun effet.", tag="use_cure_poison_error"))
+    def _use_heal_sp(self, p: dict, user: Player, ctx, gm, evs: list[CombatEvent]) -> None:
+        amt = int(p.get("amount", 0))
+        restored = user.heal_sp(amt)
+        evs.append(CombatEvent(text=f"{user.name} récupère {restored} SP.", tag="use_heal_sp", data={"amount": restored}))
 
-        elif t == "buff_attack_pct":
-            amt = float(self._payload.get("amount", 0.0))
-            dur = int(self._payload.get("duration", 1))
-            try:
-                effs = make_effect("atk_pct_buff", duration=dur, potency=amt)
-                effs = _flatten_effects(effs)
-                for eff in effs:
-                    if isinstance(gm, EffectManager):
-                        gm.apply(user, eff, source_name=f"item:{self.item_id}", ctx=ctx)
-                    else:
-                        eff.on_apply(user, ctx)
-                evs.append(CombatEvent(text=f"{user.name} sent sa force croître (+{int(amt*100)}% ATK, {dur} tour(s)).", tag="use_buff_atk"))
-            except Exception:
-                evs.append(CombatEvent(text="L’élixir pétille sans effet.", tag="use_buff_atk_fail"))
-
-        elif t == "repair_equipment":
-            target = str(self._payload.get("target", "weapon")).strip().lower()
-            amount = int(self._payload.get("amount", 10))
-            try:
-                eq = user.equipment.get(target)
-            except Exception:
-                eq = getattr(getattr(user, "equipment", None), target, None)
-            if not eq or not hasattr(eq, "durability"):
-                evs.append(CombatEvent(text="Rien à réparer.", tag="use_repair_none"))
+    def _use_cure_poison(self, p: dict, user: Player, ctx, gm, evs: list[CombatEvent]) -> None:
+        try:
+            if isinstance(gm, EffectManager):
+                removed = gm.purge(user, cls_name="PoisonEffect")
             else:
-                cur = getattr(eq.durability, "current", 0)
-                mx  = getattr(eq.durability, "maximum", cur)
-                new = min(mx, cur + amount)
-                setattr(eq.durability, "current", new)
-                evs.append(CombatEvent(text=f"{eq.name} réparée (+{new-cur}).", tag="use_repair", data={"restored": new-cur}))
-
-        elif t == "smoke_escape":
-            p = float(self._payload.get("chance", 0.5))
-            roll = (rng.random() if rng else random.random())
-            if roll < p:
-                evs.append(CombatEvent(text="Vous profitez de la fumée pour vous éclipser !", tag="use_escape", data={"success": True}))
-                evs[-1].end_combat = True
+                removed = 0
+            if removed:
+                evs.append(CombatEvent(text=f"{user.name} est purgé du poison.", tag="use_cure_poison"))
             else:
-                evs.append(CombatEvent(text="La fumée se dissipe trop vite...", tag="use_escape", data={"success": False}))
+                evs.append(CombatEvent(text="Aucun poison à purger.", tag="use_cure_poison_none"))
+        except Exception:
+            evs.append(CombatEvent(text="L’antidote n’a eu aucun effet.", tag="use_cure_poison_error"))
 
-        elif t == "apply_effect":
-            eid = self._payload.get("effect_id")
-            dur = int(self._payload.get("duration", 0))
-            pot = int(self._payload.get("potency", 0))
-            try:
-                effs = _flatten_effects(make_effect(eid, duration=dur, potency=pot))
-                for eff in effs:
-                    if isinstance(gm, EffectManager):
-                        gm.apply(user, eff, source_name=f"item:{self.item_id}", ctx=ctx)
-                    else:
-                        eff.on_apply(user, ctx)
-                if effs:
-                    evs.append(CombatEvent(text=f"{user.name} bénéficie de {effs[0].name}.", tag="use_apply_effect"))
+    def _use_buff_attack_pct(self, p: dict, user: Player, ctx, gm, evs: list[CombatEvent]) -> None:
+        amt = float(p.get("amount", 0.0))
+        dur = int(p.get("duration", 1))
+        try:
+            effs = make_effect("atk_pct_buff", duration=dur, potency=amt)
+            effs = _flatten_effects(effs)
+            for eff in effs:
+                if isinstance(gm, EffectManager):
+                    gm.apply(user, eff, source_name=f"item:{self.item_id}", ctx=ctx)
                 else:
-                    evs.append(CombatEvent(text="Rien ne se produit.", tag="use_apply_effect_none"))
-            except Exception:
-                evs.append(CombatEvent(text="L’objet crépite… sans effet notable.", tag="use_unknown"))
+                    eff.on_apply(user, ctx)
+            evs.append(CombatEvent(text=f"{user.name} sent sa force croître (+{int(amt*100)}% ATK, {dur} tour(s)).", tag="use_buff_atk"))
+        except Exception:
+            evs.append(CombatEvent(text="L’élixir pétille sans effet.", tag="use_buff_atk_fail"))
 
+    def _use_repair_equipment(self, p: dict, user: Player, ctx, gm, evs: list[CombatEvent]) -> None:
+        target = str(p.get("target", "weapon")).strip().lower()
+        amount = int(p.get("amount", 10))
+        try:
+            eq = user.equipment.get(target)
+        except Exception:
+            eq = getattr(getattr(user, "equipment", None), target, None)
+        if not eq or not hasattr(eq, "durability"):
+            evs.append(CombatEvent(text="Rien à réparer.", tag="use_repair_none"))
         else:
-            evs.append(CombatEvent(text="L’objet ne semble rien faire.", tag="use_none"))
-            return super().on_use(user, ctx)
+            cur = getattr(eq.durability, "current", 0)
+            mx  = getattr(eq.durability, "maximum", cur)
+            new = min(mx, cur + amount)
+            setattr(eq.durability, "current", new)
+            evs.append(CombatEvent(text=f"{eq.name} réparée (+{new-cur}).", tag="use_repair", data={"restored": new-cur}))
 
-        return evs
+    def _use_smoke_escape(self, p: dict, user: Player, ctx, gm, evs: list[CombatEvent]) -> None:
+        rng = getattr(getattr(ctx, "engine", None), "rng", None) if ctx else None
+        chance = float(p.get("chance", 0.5))
+        roll = (rng.random() if rng else random.random())
+        if roll < chance:
+            evs.append(CombatEvent(text="Vous profitez de la fumée pour vous éclipser !", tag="use_escape", data={"success": True}))
+            evs[-1].end_combat = True
+        else:
+            evs.append(CombatEvent(text="La fumée se dissipe trop vite...", tag="use_escape", data={"success": False}))
+
+    def _use_apply_effect(self, p: dict, user: Player, ctx, gm, evs: list[CombatEvent]) -> None:
+        eid = p.get("effect_id")
+        dur = int(p.get("duration", 0))
+        pot = int(p.get("potency", 0))
+        try:
+            effs = _flatten_effects(make_effect(eid, duration=dur, potency=pot))
+            for eff in effs:
+                if isinstance(gm, EffectManager):
+                    gm.apply(user, eff, source_name=f"item:{self.item_id}", ctx=ctx)
+                else:
+                    eff.on_apply(user, ctx)
+            if effs:
+                evs.append(CombatEvent(text=f"{user.name} bénéficie de {effs[0].name}.", tag="use_apply_effect"))
+            else:
+                evs.append(CombatEvent(text="Rien ne se produit.", tag="use_apply_effect_none"))
+        except Exception:
+            evs.append(CombatEvent(text="L’objet crépite… sans effet notable.", tag="use_unknown"))
+
+
+# type d'usage JSON -> handler de DataConsumable (type inconnu => Consumable.on_use générique)
+_USE_HANDLERS: dict[str, Callable[..., None]] = {
+    "heal_hp": DataConsumable._use_heal_hp,
+    "heal_sp": DataConsumable._use_heal_sp,
+    "cure_poison": DataConsumable._use_cure_poison,
+    "buff_attack_pct": DataConsumable._use_buff_attack_pct,
+    "repair_equipment": DataConsumable._use_repair_equipment,
+    "smoke_escape": DataConsumable._use_smoke_escape,
+    "apply_effect": DataConsumable._use_apply_effect,
+}
 
 
 def load_items() -> dict[str, Callable[[], DataConsumable]]:
@@ -402,8 +444,8 @@ def load_items() -> dict[str, Callable[[], DataConsumable]]:
             if not stackable:
                 continue
 
-            def _factory(_id=item_id, _n=name, _d=desc, _m=max_stack, _p=use_payload,
-                         _tier=tier, _tags=tags, _zones=zones, _sw=shop_w, _dw=drop_w, _bp=base_price):
+            def _build(_id=item_id, _n=name, _d=desc, _m=max_stack, _p=use_payload,
+                       _tier=tier, _tags=tags, _zones=zones, _sw=shop_w, _dw=drop_w, _bp=base_price):
                 it = DataConsumable(item_id=_id, name=_n, description=_d, max_stack=_m, payload=_p, kind=None)
                 setattr(it, "tier", _tier)
                 setattr(it, "tags", _tags)
@@ -414,7 +456,9 @@ def load_items() -> dict[str, Callable[[], DataConsumable]]:
                 setattr(it, "stackable", True)
                 return it
 
-            res[item_id] = _factory
+            # flyweight: toutes les unités d'un même item_id partagent une instance
+            forget_item(item_id)  # la définition vient d'être (re)lue
+            res[item_id] = lambda _id=item_id, _b=_build: get_item(_id, _b)
         except Exception:
             continue
     return res
@@ -505,7 +549,7 @@ def load_enemy_blueprints(attacks_registry: dict[str, Attack]) -> dict[str, Enem
             continue
         for path in folder.glob("*.json"):
             try:
-                raw = json.loads(path.read_text(encoding="utf-8"))
+                raw = read_json_cached(path)
                 rows = raw if isinstance(raw, list) else [raw]
             except Exception:
                 continue
@@ -575,7 +619,7 @@ def load_encounter_tables() -> dict[str, dict[str, list[dict]]]:
             continue
         for path in folder.glob("*.json"):
             try:
-                raw = json.loads(path.read_text(encoding="utf-8"))
+                raw = read_json_cached(path)
             except Exception:
                 continue
 
@@ -614,7 +658,7 @@ def load_equipment_zone_index() -> dict[str, dict[str, list[str]]]:
             if not p.exists(): 
                 continue
             try:
-                rows = json.loads(p.read_text(encoding="utf-8"))
+                rows = read_json_cached(p)
                 for r in rows:
                     zones = [str(z).upper() for z in r.get("zones", [])]
                     out[kind][r["id"]] = zones
@@ -662,7 +706,7 @@ def load_equipment_banks() -> tuple[list[Weapon], list[Armor], list[Artifact]]:
         wpath = eqdir / "weapons.json"
         if wpath.exists():
             try:
-                rows = json.loads(wpath.read_text(encoding="utf-8"))
+                rows = read_json_cached(wpath)
                 for row in rows:
                     name = row.get("name", row.get("id", "weapon"))
                     dmax = int(row.get("durability_max", 10))
@@ -677,7 +721,7 @@ def load_equipment_banks() -> tuple[list[Weapon], list[Armor], list[Artifact]]:
         apath = eqdir / "armors.json"
         if apath.exists():
             try:
-                rows = json.loads(apath.read_text(encoding="utf-8"))
+                rows = read_json_cached(apath)
                 for row in rows:
                     name = row.get("name", row.get("id", "armor"))
                     dmax = int(row.get("durability_max", 12))
@@ -692,7 +736,7 @@ def load_equipment_banks() -> tuple[list[Weapon], list[Armor], list[Artifact]]:
         rpath = eqdir / "artifacts.json"
         if rpath.exists():
             try:
-                rows = json.loads(rpath.read_text(encoding="utf-8"))
+                rows = read_json_cached(rpath)
                 for row in rows:
                     name = row.get("name", row.get("id", "artifact"))
                     dmax = int(row.get("durability_max", 8))
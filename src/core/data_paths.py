@@ -6,6 +6,21 @@ import os
 
 APP_NAME = "ruines_ascendantes"
 
+def _find_project_data_dir() -> Path | None:
+    """Remonte depuis ce fichier jusqu'au premier dossier contenant 'data' (src/data)."""
+    p = os.path.dirname(os.path.realpath(__file__))
+    while True:
+        cand = os.path.join(p, "data")
+        if os.path.isdir(cand):
+            return Path(cand)
+        parent = os.path.dirname(p)
+        if parent == p:
+            return None
+        p = parent
+
+# Résolu une seule fois à l'import (la structure du projet ne bouge pas en cours d'exécution)
+_PROJECT_DATA_DIR = _find_project_data_dir()
+
 def default_data_dirs() -> list[Path]:
     dirs: list[Path] = []
 
@@ -19,14 +34,9 @@ def default_data_dirs() -> list[Path]:
         dirs.append(Path(env))
 
     # 3) fallback projet: src/data/
-    here = Path(__file__).resolve()
-    # remonte jusqu'à 'src/' puis 'src/data'
-    for p in here.parents:
-        maybe = p / "data"
-        if maybe.is_dir():
-            dirs.append(maybe)
-            break
-    
+    if _PROJECT_DATA_DIR is not None:
+        dirs.append(_PROJECT_DATA_DIR)
+
     return dirs
 
 def iter_category_files(category: str, suffix: str = ".json"):
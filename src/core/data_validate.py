@@ -6,27 +6,117 @@ Exécution:
 
 from typing import Any, TYPE_CHECKING
 from dataclasses import dataclass
+import json
 
 from core.data_loader import (
     load_attacks,
     load_enemy_blueprints,
     load_encounter_tables,
     load_equipment_banks,
-    default_data_dirs
+    read_json_cached,
+    default_data_dirs,
+    EnemyBlueprint,
 )
+from core.data_paths import APP_NAME
 from pathlib import Path
 
+try:  # optionnel: validateur compilé (sinon: contrôles manuels seuls)
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 if TYPE_CHECKING:
     from core.equipment import Equipment
 
 # --- Constantes de zones (strings, car les JSON stockent des noms) ---
-ZONE_NAMES = {"RUINS", "CAVES", "FOREST", "DESERT"}
+ZONE_NAMES = frozenset({"RUINS", "CAVES", "FOREST", "DESERT"})
 
 # --- Effets d'event pris en charge (cf. EventEngine._apply_effect_payload) ---
-EVENT_EFFECT_TYPES = {"heal_hp_pct", "give_gold", "damage_hp", "apply_effect", "start_combat"}
+EVENT_EFFECT_TYPES = frozenset({"heal_hp_pct", "give_gold", "damage_hp", "apply_effect", "start_combat"})
 
 # --- Stats autorisées dans "requires" ---
-REQUIRE_STATS = {"attack", "defense", "luck"}
+REQUIRE_STATS = frozenset({"attack", "defense", "luck"})
+
+# Versions internes triées (tests `in` sur petit tuple + listes "allowed=" figées pour les messages)
+_ZONE_NAMES = tuple(sorted(ZONE_NAMES))
+_EVENT_EFFECT_TYPES = tuple(sorted(EVENT_EFFECT_TYPES))
+_REQUIRE_STATS = tuple(sorted(REQUIRE_STATS))
+_ZONES_ALLOWED = str(list(_ZONE_NAMES))
+_EFFECTS_ALLOWED = str(list(_EVENT_EFFECT_TYPES))
+_STATS_ALLOWED = str(list(_REQUIRE_STATS))
+
+# --- Schéma d'un event (corps uniquement: les zones dépendent du fichier → post-pass) ---
+# Plus strict que les contrôles manuels: un event valide au schéma ne produit aucune erreur,
+# un event refusé repasse par les contrôles manuels pour des messages détaillés.
+_NON_EMPTY_STR = {"type": "string", "pattern": r"\S"}
+_EFFECT_RULES = {
+    "heal_hp_pct": {"required": ["amount_pct"],
+                    "properties": {"amount_pct": {"type": "integer", "minimum": 1, "maximum": 100}}},
+    "give_gold": {"required": ["amount"], "properties": {"amount": {"type": "integer", "minimum": 0}}},
+    "damage_hp": {"required": ["amount"], "properties": {"amount": {"type": "integer", "minimum": 1}}},
+    "apply_effect": {"required": ["effect_id"],
+                     "properties": {"effect_id": _NON_EMPTY_STR,
+                                    "duration": {"type": "integer", "minimum": 0},
+                                    "potency": {"type": "integer"}}},
+    "start_combat": {"properties": {"boss": {"type": "boolean"}}},
+}
+_EFFECT_SCHEMA = {
+    "type": "object",
+    "required": ["type"],
+    "properties": {"type": {"enum": list(_EVENT_EFFECT_TYPES)}},
+    "allOf": [
+        {"if": {"properties": {"type": {"const": t}}}, "then": rule}
+        for t, rule in _EFFECT_RULES.items()
+    ],
+}
+_EFFECT_LIST = {"type": ["array", "null"], "items": _EFFECT_SCHEMA}
+EVENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "weight": {"type": "integer", "minimum": 1},
+        "text": {"type": "object", "required": ["fr"], "properties": {"fr": _NON_EMPTY_STR}},
+        "options": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["id", "label"],
+                "properties": {
+                    "id": _NON_EMPTY_STR,
+                    "label": {"type": "object", "required": ["fr"], "properties": {"fr": _NON_EMPTY_STR}},
+                    "requires": {
+                        "type": ["array", "null"],
+                        "items": {
+                            "type": "object",
+                            "required": ["stat", "gte"],
+                            "properties": {"stat": {"enum": list(_REQUIRE_STATS)},
+                                           "gte": {"type": "integer", "minimum": 0}},
+                        },
+                    },
+                    "effects": _EFFECT_LIST,
+                    "on_fail": _EFFECT_LIST,
+                },
+            },
+        },
+    },
+    "required": ["text", "options"],
+}
+_EVENT_VALIDATE = fastjsonschema.compile(EVENT_SCHEMA) if fastjsonschema is not None else None
+
+
+def _event_schema_ok(ev: Any) -> bool:
+    """True si le validateur compilé accepte l'event (False si indisponible)."""
+    if _EVENT_VALIDATE is None:
+        return False
+    try:
+        _EVENT_VALIDATE(ev)
+    except fastjsonschema.JsonSchemaException:
+        return False
+    return True
+
+# --- Cache disque des rapports par fichier (clé: chemin, invalidé par mtime/taille) ---
+VALIDATION_CACHE_PATH = Path.home() / f".{APP_NAME}" / "cache" / "validation.json"
+_VALIDATION_CACHE_VERSION = 1
 
 
 @dataclass
@@ -90,10 +180,9 @@ def _pct(value: Any, name: str, ctx: str) -> list[str]:
 
 # ---------- Validators (existing) ----------
 
-def validate_enemies(attacks_reg: dict[str, Any]) -> Report:
-    # ensure latest
+def validate_enemies(blueprints: dict[str, EnemyBlueprint]) -> Report:
+    """Valide des blueprints déjà chargés (cf. load_enemy_blueprints)."""
     rep = Report(errors=[], warnings=[])
-    blueprints = load_enemy_blueprints(attacks_reg)
 
     if not blueprints:
         rep.warnings.append("No enemies found under data/enemies/.")
@@ -136,22 +225,30 @@ def validate_encounters(blueprints: dict[str, Any]) -> Report:
         rep.warnings.append("No encounter tables found under data/encounters/.")
         return rep
 
+    # 1 passe: structure + poids; les enemy_id sont regroupés puis comparés en bloc
+    seen: dict[str, list[str]] = {}   # enemy_id -> contextes "encounters:zone.bucket"
     for zone_name, buckets in tables.items():
-        if zone_name not in ZONE_NAMES:
-            rep.errors.append(f"encounters:{zone_name}: unknown zone; allowed={sorted(ZONE_NAMES)}")
+        if zone_name not in _ZONE_NAMES:
+            rep.errors.append(f"encounters:{zone_name}: unknown zone; allowed={_ZONES_ALLOWED}")
         for bucket_name in ("normal", "boss"):
             rows = buckets.get(bucket_name, [])
+            where = f"encounters:{zone_name}.{bucket_name}"
             if not rows:
-                rep.warnings.append(f"encounters:{zone_name}.{bucket_name}: empty list.")
+                rep.warnings.append(f"{where}: empty list.")
                 continue
             for row in rows:
                 eid = str(row.get("enemy_id", ""))
-                w = row.get("weight", 1)
-                if not eid:
-                    rep.errors.append(f"encounters:{zone_name}.{bucket_name}: missing enemy_id.")
-                elif eid not in blueprints:
-                    rep.errors.append(f"encounters:{zone_name}.{bucket_name}: enemy_id '{eid}' not found in enemies.")
-                rep.errors += _pos_int(w, "weight", f"encounters:{zone_name}.{bucket_name}({eid})")
+                if eid:
+                    seen.setdefault(eid, []).append(where)
+                else:
+                    rep.errors.append(f"{where}: missing enemy_id.")
+                rep.errors += _pos_int(row.get("weight", 1), "weight", f"{where}({eid})")
+
+    missing = seen.keys() - blueprints.keys()
+    if missing:
+        for eid, wheres in seen.items():
+            if eid in missing:
+                rep.errors.extend(f"{where}: enemy_id '{eid}' not found in enemies." for where in wheres)
 
     return rep
 
@@ -193,20 +290,43 @@ def validate_equipment() -> Report:
     return rep
 
 
+# ---------- Cache de validation ----------
+
+def _load_validation_cache() -> dict[str, dict]:
+    """Retourne {chemin: {mtime_ns, size, errors, warnings}} (vide si absent/invalide)."""
+    try:
+        raw = json.loads(VALIDATION_CACHE_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    if not isinstance(raw, dict) or raw.get("version") != _VALIDATION_CACHE_VERSION:
+        return {}
+    files = raw.get("files")
+    return files if isinstance(files, dict) else {}
+
+def _save_validation_cache(files: dict[str, dict]) -> None:
+    try:
+        VALIDATION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"version": _VALIDATION_CACHE_VERSION, "files": files}
+        VALIDATION_CACHE_PATH.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    except OSError:
+        pass
+
+
 # ---------- NEW: Events ----------
 
 def _validate_event_effect(payload: dict, *, ctx: str) -> list[str]:
     errs: list[str] = []
     t = payload.get("type")
-    if t not in EVENT_EFFECT_TYPES:
-        errs.append(f"{ctx}: unknown effect type '{t}'. allowed={sorted(EVENT_EFFECT_TYPES)}")
+    if t not in _EVENT_EFFECT_TYPES:
+        errs.append(f"{ctx}: unknown effect type '{t}'. allowed={_EFFECTS_ALLOWED}")
         return errs
 
     if t == "heal_hp_pct":
-        errs += _pos_int(payload.get("amount_pct"), "amount_pct", ctx)
+        pct = payload.get("amount_pct")
+        errs += _pos_int(pct, "amount_pct", ctx)
         # 1..100 (on tolère 0 si vraiment souhaité, modifie zero_ok=True)
         try:
-            if not (1 <= int(payload.get("amount_pct", 0)) <= 100):
+            if not (1 <= int(pct if pct is not None else 0) <= 100):
                 errs.append(f"{ctx}: 'amount_pct' should be within [1,100]")
         except Exception:
             pass
@@ -238,11 +358,153 @@ def _validate_event_effect(payload: dict, *, ctx: str) -> list[str]:
     return errs
 
 
-def validate_events() -> Report:
-    """Valide data/events/ (format 'event_<zone>.json' ou anciens formats)."""
-    import json
+def _validate_event_body(ev: dict, ev_ctx: str, rep: Report) -> None:
+    """Contrôles manuels: weight, text.fr, options (messages détaillés)."""
+    # weight
+    w = ev.get("weight", 1)
+    rep.errors += _pos_int(w, "weight", ev_ctx)
+
+    # text.fr
+    text = ev.get("text")
+    fr = text.get("fr") if isinstance(text, dict) else None
+    if not (isinstance(fr, str) and fr.strip()):
+        rep.errors.append(f"{ev_ctx}: missing/empty 'text.fr'")
+
+    # options
+    options = ev.get("options", [])
+    if not isinstance(options, list) or not options:
+        rep.errors.append(f"{ev_ctx}: 'options' must be a non-empty list")
+        return
+
+    # chaque option
+    for opt in options:
+        get = opt.get
+        oid = get("id", "")
+        o_ctx = f"{ev_ctx}:option:{oid or 'NO_ID'}"
+
+        if not isinstance(oid, str) or not oid.strip():
+            rep.errors.append(f"{o_ctx}: missing/empty 'id'")
+
+        lab = get("label")
+        fr = lab.get("fr") if isinstance(lab, dict) else None
+        if not (isinstance(fr, str) and fr.strip()):
+            rep.errors.append(f"{o_ctx}: missing/empty 'label.fr'")
+
+        # requires (facultatif)
+        reqs = get("requires", [])
+        if reqs is not None:
+            if not isinstance(reqs, list):
+                rep.errors.append(f"{o_ctx}: 'requires' must be a list if provided")
+            else:
+                for r in reqs:
+                    if not isinstance(r, dict):
+                        rep.errors.append(f"{o_ctx}: requires entry must be an object")
+                        continue
+                    st = r.get("stat")
+                    if st not in _REQUIRE_STATS:
+                        rep.errors.append(f"{o_ctx}: requires.stat '{st}' invalid; allowed={_STATS_ALLOWED}")
+                    errs = _pos_int(r.get("gte"), "gte", o_ctx, zero_ok=True)
+                    rep.errors += errs
+
+        # effects
+        effs = get("effects", [])
+        if effs is None:
+            effs = []
+        if not isinstance(effs, list):
+            rep.errors.append(f"{o_ctx}: 'effects' must be a list")
+            effs = []
+        for i, payload in enumerate(effs):
+            if not isinstance(payload, dict):
+                rep.errors.append(f"{o_ctx}: effects[{i}] must be an object")
+                continue
+            rep.errors += _validate_event_effect(payload, ctx=f"{o_ctx}:effects[{i}]")
+
+        # on_fail
+        fails = get("on_fail", [])
+        if fails is None:
+            fails = []
+        if not isinstance(fails, list):
+            rep.errors.append(f"{o_ctx}: 'on_fail' must be a list")
+            fails = []
+        for i, payload in enumerate(fails):
+            if not isinstance(payload, dict):
+                rep.errors.append(f"{o_ctx}: on_fail[{i}] must be an object")
+                continue
+            rep.errors += _validate_event_effect(payload, ctx=f"{o_ctx}:on_fail[{i}]")
 
+
+def _validate_event_file(path: Path) -> Report:
+    """Valide un fichier d'events (sans cache)."""
     rep = Report(errors=[], warnings=[])
+    try:
+        raw = read_json_cached(path)
+    except Exception as e:
+        rep.errors.append(f"events:{path.name}: invalid JSON: {e}")
+        return rep
+
+    file_zone = None
+    events_payload: list[dict] = []
+
+    # Format 1 (nouveau) : { "zone": "RUINS", "events": [ {...}, ... ] }
+    if isinstance(raw, dict) and "events" in raw and isinstance(raw["events"], list):
+        file_zone = str(raw.get("zone", "")).upper()
+        if file_zone and file_zone not in _ZONE_NAMES:
+            rep.errors.append(f"events:{path.name}: unknown zone '{file_zone}'; allowed={_ZONES_ALLOWED}")
+        events_payload = list(raw["events"])
+
+    # Format 2 : un seul event dict
+    elif isinstance(raw, dict):
+        events_payload = [raw]
+
+    # Format 3 : liste d'events
+    elif isinstance(raw, list):
+        events_payload = raw
+
+    else:
+        rep.errors.append(f"events:{path.name}: unsupported structure (must be dict or list)")
+        return rep
+
+    # Validation de chaque event
+    for ev in events_payload:
+        ev_id = ev.get("id", "")
+        ev_ctx = f"events:{path.name}:{ev_id or 'NO_ID'}"
+
+        # id
+        if not isinstance(ev_id, str) or not ev_id.strip():
+            rep.errors.append(f"{ev_ctx}: missing/empty 'id'")
+
+        # zone_types (si pas fourni et format 1, injecté depuis file_zone)
+        zone_types = ev.get("zone_types")
+        if not zone_types and file_zone:
+            zone_types = [file_zone]
+        if not zone_types:
+            rep.errors.append(f"{ev_ctx}: missing 'zone_types' (and no file-level 'zone')")
+            zset = []
+        else:
+            if not isinstance(zone_types, list) or not all(isinstance(z, str) for z in zone_types):
+                rep.errors.append(f"{ev_ctx}: 'zone_types' must be a list[str]")
+                zset = []
+            else:
+                zset = [z.upper() for z in zone_types]
+                for z in zset:
+                    if z not in _ZONE_NAMES:
+                        rep.errors.append(f"{ev_ctx}: unknown zone '{z}' in zone_types; allowed={_ZONES_ALLOWED}")
+
+        # corps (weight, text, options): schéma compilé d'abord, contrôles détaillés sinon
+        if not _event_schema_ok(ev):
+            _validate_event_body(ev, ev_ctx, rep)
+
+    return rep
+
+
+def validate_events(*, use_cache: bool = True) -> Report:
+    """Valide data/events/ (format 'event_<zone>.json' ou anciens formats).
+
+    Les rapports par fichier sont mis en cache sur disque (clé: mtime + taille).
+    """
+    rep = Report(errors=[], warnings=[])
+    cache = _load_validation_cache() if use_cache else {}
+    dirty = False
 
     found_any = False
     for base in default_data_dirs():
@@ -252,128 +514,25 @@ def validate_events() -> Report:
 
         for path in folder.glob("*.json"):
             found_any = True
-            try:
-                raw = json.loads(path.read_text(encoding="utf-8"))
-            except Exception as e:
-                rep.errors.append(f"events:{path.name}: invalid JSON: {e}")
+            st = path.stat()
+            key = str(path)
+            hit = cache.get(key)
+            if hit and hit.get("mtime_ns") == st.st_mtime_ns and hit.get("size") == st.st_size:
+                rep.errors.extend(hit.get("errors", []))
+                rep.warnings.extend(hit.get("warnings", []))
                 continue
-
-            file_zone = None
-            events_payload: list[dict] = []
-
-            # Format 1 (nouveau) : { "zone": "RUINS", "events": [ {...}, ... ] }
-            if isinstance(raw, dict) and "events" in raw and isinstance(raw["events"], list):
-                file_zone = str(raw.get("zone", "")).upper()
-                if file_zone and file_zone not in ZONE_NAMES:
-                    rep.errors.append(f"events:{path.name}: unknown zone '{file_zone}'; allowed={sorted(ZONE_NAMES)}")
-                events_payload = list(raw["events"])
-
-            # Format 2 : un seul event dict
-            elif isinstance(raw, dict):
-                events_payload = [raw]
-
-            # Format 3 : liste d'events
-            elif isinstance(raw, list):
-                events_payload = raw
-
-            else:
-                rep.errors.append(f"events:{path.name}: unsupported structure (must be dict or list)")
-                continue
-
-            # Validation de chaque event
-            for ev in events_payload:
-                ev_id = ev.get("id", "")
-                ev_ctx = f"events:{path.name}:{ev_id or 'NO_ID'}"
-
-                # id
-                if not isinstance(ev_id, str) or not ev_id.strip():
-                    rep.errors.append(f"{ev_ctx}: missing/empty 'id'")
-
-                # zone_types (si pas fourni et format 1, injecté depuis file_zone)
-                zone_types = ev.get("zone_types")
-                if not zone_types and file_zone:
-                    zone_types = [file_zone]
-                if not zone_types:
-                    rep.errors.append(f"{ev_ctx}: missing 'zone_types' (and no file-level 'zone')")
-                    zset = []
-                else:
-                    if not isinstance(zone_types, list) or not all(isinstance(z, str) for z in zone_types):
-                        rep.errors.append(f"{ev_ctx}: 'zone_types' must be a list[str]")
-                        zset = []
-                    else:
-                        zset = [z.upper() for z in zone_types]
-                        for z in zset:
-                            if z not in ZONE_NAMES:
-                                rep.errors.append(f"{ev_ctx}: unknown zone '{z}' in zone_types; allowed={sorted(ZONE_NAMES)}")
-
-                # weight
-                w = ev.get("weight", 1)
-                rep.errors += _pos_int(w, "weight", ev_ctx)
-
-                # text.fr
-                text = ev.get("text", {})
-                if not (isinstance(text, dict) and isinstance(text.get("fr", ""), str) and text.get("fr", "").strip()):
-                    rep.errors.append(f"{ev_ctx}: missing/empty 'text.fr'")
-
-                # options
-                options = ev.get("options", [])
-                if not isinstance(options, list) or not options:
-                    rep.errors.append(f"{ev_ctx}: 'options' must be a non-empty list")
-                    continue
-
-                # chaque option
-                for opt in options:
-                    oid = opt.get("id", "")
-                    o_ctx = f"{ev_ctx}:option:{oid or 'NO_ID'}"
-
-                    if not isinstance(oid, str) or not oid.strip():
-                        rep.errors.append(f"{o_ctx}: missing/empty 'id'")
-
-                    lab = opt.get("label", {})
-                    if not (isinstance(lab, dict) and isinstance(lab.get("fr", ""), str) and lab.get("fr", "").strip()):
-                        rep.errors.append(f"{o_ctx}: missing/empty 'label.fr'")
-
-                    # requires (facultatif)
-                    reqs = opt.get("requires", [])
-                    if reqs is not None:
-                        if not isinstance(reqs, list):
-                            rep.errors.append(f"{o_ctx}: 'requires' must be a list if provided")
-                        else:
-                            for r in reqs:
-                                if not isinstance(r, dict):
-                                    rep.errors.append(f"{o_ctx}: requires entry must be an object")
-                                    continue
-                                st = r.get("stat")
-                                if st not in REQUIRE_STATS:
-                                    rep.errors.append(f"{o_ctx}: requires.stat '{st}' invalid; allowed={sorted(REQUIRE_STATS)}")
-                                errs = _pos_int(r.get("gte"), "gte", o_ctx, zero_ok=True)
-                                rep.errors += errs
-
-                    # effects
-                    effs = opt.get("effects", [])
-                    if effs is None:
-                        effs = []
-                    if not isinstance(effs, list):
-                        rep.errors.append(f"{o_ctx}: 'effects' must be a list")
-                        effs = []
-                    for i, payload in enumerate(effs):
-                        if not isinstance(payload, dict):
-                            rep.errors.append(f"{o_ctx}: effects[{i}] must be an object")
-                            continue
-                        rep.errors += _validate_event_effect(payload, ctx=f"{o_ctx}:effects[{i}]")
-
-                    # on_fail
-                    fails = opt.get("on_fail", [])
-                    if fails is None:
-                        fails = []
-                    if not isinstance(fails, list):
-                        rep.errors.append(f"{o_ctx}: 'on_fail' must be a list")
-                        fails = []
-                    for i, payload in enumerate(fails):
-                        if not isinstance(payload, dict):
-                            rep.errors.append(f"{o_ctx}: on_fail[{i}] must be an object")
-                            continue
-                        rep.errors += _validate_event_effect(payload, ctx=f"{o_ctx}:on_fail[{i}]")
+            file_rep = _validate_event_file(path)
+            cache[key] = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "errors": file_rep.errors,
+                "warnings": file_rep.warnings,
+            }
+            dirty = True
+            rep.extend(file_rep)
+
+    if use_cache and dirty:
+        _save_validation_cache(cache)
 
     if not found_any:
         rep.warnings.append("No events found under data/events/.")
@@ -387,12 +546,12 @@ def validate_all(verbose: bool = True) -> Report:
     # Attaques (pour résolution des ids d'ennemis)
     attacks_reg = load_attacks()
 
-    # Enemies
-    enemies_rep = validate_enemies(attacks_reg)
+    # Enemies (chargés une seule fois, partagés avec encounters)
+    enemy_bps = load_enemy_blueprints(attacks_reg)
+    enemies_rep = validate_enemies(enemy_bps)
     report.extend(enemies_rep)
 
     # Encounters
-    enemy_bps = load_enemy_blueprints(attacks_reg)
     encounters_rep = validate_encounters(enemy_bps)
     report.extend(encounters_rep)
 
@@ -1,7 +1,8 @@
 from __future__ import annotations
 """Gestionnaire d'effets persistants (sans modifier Entity).
 
-- Mappe chaque entité vers une liste d'effets actifs.
+- Mappe chaque entité (par id) vers une liste d'effets actifs.
+- Le propriétaire du combat appelle drop(entité) quand elle disparaît (fin de combat).
 - Appelle les hooks aux bons moments: on_apply, on_turn_end, on_expire.
 - Copie défensive des effets appliqués pour éviter le partage d'instances.
 """
@@ -9,15 +10,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 from enum import Enum
-from weakref import WeakKeyDictionary
 import copy
 
 from core.combat import CombatEvent
+from core.effects import Effect, CAP_ON_APPLY, CAP_ON_EXPIRE, CAP_ON_HIT, CAP_ON_TURN_END, CAP_IS_EXPIRED, tick_poisons
 if TYPE_CHECKING:
     from core.combat import CombatContext
     from core.entity import Entity
-    from core.effects import Effect
 
+__all__ = ["EffectManager", "EffectInstance", "StackPolicy"]
 
 @dataclass
 class EffectInstance:
@@ -34,20 +35,24 @@ class EffectManager:
     '''Enregistre, applique et purge les effets par entité'''
 
     def __init__(self):
-        self._active: WeakKeyDictionary[object, list[EffectInstance]] = WeakKeyDictionary()
+        self._active: dict[int, list[EffectInstance]] = {}  # id(entité) -> effets
     
     # --- Query ---
     def get_effects(self, target : Entity) -> list[EffectInstance]:
-        return tuple(self._active.get(target, ()))
+        return tuple(self._active.get(id(target), ()))
+
+    def drop(self, target: Entity) -> None:
+        """Oublie les effets d'une entité (sans hooks). À appeler quand elle quitte le jeu."""
+        self._active.pop(id(target), None)
     
     def _same_kind(self, a: Effect, b: Effect) -> bool:
         # Ajuste le critère si tu ajoutes un champ `id` sur Effect
-        return type(a) is type(b) and a.name == b.name
+        return a.kind == b.kind and a.stat_field == b.stat_field and a.name == b.name and type(a) is type(b)
     
     # --- Apply / Remove ---
-    def apply(self, target: Entity, effect: Effect, *, source_name: str | None = None, ctx: CombatContext | None = None, policy: StackPolicy = StackPolicy.REFRESH, max_stacks: int):
+    def apply(self, target: Entity, effect: Effect, *, source_name: str | None = None, ctx: CombatContext | None = None, policy: StackPolicy = StackPolicy.REFRESH, max_stacks: int = 1):
         '''Ajoute une copie de l'effet à la cible. Appelle optionnellement on_apply s'il existe.'''
-        lst = self._active.setdefault(target, [])
+        lst = self._active.setdefault(id(target), [])
 
         # Gestion de l'existant selon la politique
         if policy != StackPolicy.STACK:
@@ -67,47 +72,95 @@ class EffectManager:
 
         inst = EffectInstance(effect=copy.deepcopy(effect), source_name=source_name)
         lst.append(inst)
-        if ctx is not None:
+        if ctx is not None and inst.effect._caps & CAP_ON_APPLY:
             inst.effect.on_apply(target, ctx)
 
+    def purge(self, target: Entity, *, cls_name: str | None = None) -> int:
+        """Retire (sans hooks) les effets de la cible, filtrés par nom de classe. Retourne le nombre retiré."""
+        key = id(target)
+        lst = self._active.get(key)
+        if not lst:
+            return 0
+        keep = [i for i in lst if cls_name is not None and i.effect.cls_name != cls_name]
+        removed = len(lst) - len(keep)
+        if keep:
+            self._active[key] = keep
+        else:
+            del self._active[key]
+        return removed
+
+    def clear_all(self, target: Entity) -> None:
+        """Retire tous les effets de la cible (sans hooks)."""
+        self.drop(target)
+
     def purge_expired(self, target: Entity, ctx: CombatContext | None = None):
         '''Supprime les effets expirés et appelle on_expire s'il existe'''
-        lst = self._active.get(target, [])
+        key = id(target)
+        lst = self._active.get(key, [])
         keep: list[EffectInstance] = []
         for inst in lst:
-            if inst.effect.is_expired():
-                if ctx is not None:
-                    inst.effect.on_expire(target, ctx)
+            e = inst.effect
+            # lecture directe de la durée, sauf si la classe redéfinit is_expired
+            if (e.is_expired() if e._caps & CAP_IS_EXPIRED else e.duration <= 0):
+                if ctx is not None and e._caps & CAP_ON_EXPIRE:
+                    e.on_expire(target, ctx)
             else:
                 keep.append(inst)
         if keep:
-            self._active[target] = keep
-        elif target in self._active:
-            del self._active[target]
+            self._active[key] = keep
+        else:
+            self._active.pop(key, None)
     
     # --- Ticks ---
     def on_turn_end(self, target: Entity, ctx: CombatContext):
-        """À appeler à la fin du tour du *porteur* (ctx.attacker == target)."""
-        for inst in list(self._active.get(target, [])):
-            inst.effect.on_turn_end(ctx)
-        self.purge_expired(target, ctx)
+        """À appeler à la fin du tour du *porteur* (ctx.attacker == target).
+        Poisons tickés en bloc, puis une seule passe: autres hooks on_turn_end + tri expirés/actifs."""
+        key = id(target)
+        lst = self._active.get(key)
+        if not lst:
+            return
+        poisons = [e for inst in lst if (e := inst.effect).kind == "poison" and type(e) is Effect]
+        if poisons:
+            tick_poisons(target, poisons, ctx.events)
+
+        keep: list[EffectInstance] = []
+        expired: list[Effect] = []
+        for inst in lst:
+            e = inst.effect
+            caps = e._caps
+            if caps & CAP_ON_TURN_END and not (e.kind == "poison" and type(e) is Effect):
+                e.on_turn_end(ctx)
+            if (e.is_expired() if caps & CAP_IS_EXPIRED else e.duration <= 0):
+                expired.append(e)
+            else:
+                keep.append(inst)
+
+        if keep:
+            self._active[key] = keep
+        else:
+            self._active.pop(key, None)
+        for e in expired:
+            if e._caps & CAP_ON_EXPIRE:
+                e.on_expire(target, ctx)
     
         # --- Diffusion des hooks "on_hit" ---
     def on_hit(self, attacker: Entity, defender: Entity, ctx: CombatContext):
         """À appeler quand une attaque touche: notifie effets des deux côtés."""
-        for inst in self._active.get(attacker, []):
-            inst.effect.on_hit(ctx)
-        for inst in self._active.get(defender, []):
-            inst.effect.on_hit(ctx)
+        for inst in self._active.get(id(attacker), []):
+            if inst.effect._caps & CAP_ON_HIT:
+                inst.effect.on_hit(ctx)
+        for inst in self._active.get(id(defender), []):
+            if inst.effect._caps & CAP_ON_HIT:
+                inst.effect.on_hit(ctx)
 
     # --- Sauvegarde / Restauration ---
     def snapshot(self, target: Entity) -> list[dict]:
         """Sérialise effets actifs (pour save)."""
         out = []
-        for inst in self._active.get(target, []):
+        for inst in self._active.get(id(target), []):
             e = inst.effect
             out.append({
-                "cls": type(e).__name__,
+                "cls": e.cls_name,
                 "name": e.name,
                 "duration": e.duration,
                 "potency": e.potency,
@@ -116,7 +169,7 @@ class EffectManager:
         return out
 
     def restore(self, target: Entity, rows: list[dict], registry: dict, ctx: CombatContext | None = None):
-        """Restaure depuis snapshot. `registry` mappe 'cls' -> constructeur."""
+        """Restaure depuis snapshot. `registry` mappe 'cls' -> constructeur (cf. EFFECT_FACTORIES)."""
         for r in rows:
             ctor = registry.get(r["cls"])
             if not ctor:
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Literal, TYPE_CHECKING
+import sys
 
 from core.combat import CombatContext, CombatEvent
 
@@ -20,7 +21,33 @@ if TYPE_CHECKING:
 
 TargetSide = Literal["self", "target"]
 
-@dataclass
+_CE = CombatEvent   # constructeur lié une fois (hooks appelés à chaque tick)
+
+# Capacités: bits des hooks réellement actifs (par kind, ou surchargés par une sous-classe)
+CAP_ON_APPLY, CAP_ON_EXPIRE, CAP_ON_HIT, CAP_ON_TURN_END, CAP_IS_EXPIRED = 1, 2, 4, 8, 16
+_CAP_HOOKS = (("on_apply", CAP_ON_APPLY), ("on_expire", CAP_ON_EXPIRE), ("on_hit", CAP_ON_HIT),
+              ("on_turn_end", CAP_ON_TURN_END), ("is_expired", CAP_IS_EXPIRED))
+_KIND_CAPS = {"poison": CAP_ON_TURN_END, "buff": CAP_ON_APPLY | CAP_ON_EXPIRE}
+
+# Tags d'events (internés: comparaisons par identité côté UI/logs)
+TAG_POISON = sys.intern("poison_tick")
+
+# Templates de texte (str % tuple, sans f-string dans les hooks)
+_POISON_TEXT = "%s subit %s dégats de poison."
+_BUFF_APPLY_TEXT = "%s gagne +%s %s."
+_BUFF_EXPIRE_TEXT = "Le buff %s de %s expire."
+
+def _buff_row(abbr: str, tag: str, label: str, cls_name: str) -> tuple[str, str, str, str, str]:
+    return (abbr, sys.intern(f"{tag}_apply"), sys.intern(f"{tag}_expire"), label, cls_name)
+
+# Buffs de stat: champ de Stats -> (abréviation, tag apply, tag expire, libellé d'expiration, nom historique)
+STAT_BUFFS = {
+    "attack":  _buff_row("ATK", "buff_attack",  "d'attaque",  "AttackBuffEffect"),
+    "defense": _buff_row("DEF", "buff_defense", "de défense", "DefenseBuffEffect"),
+    "luck":    _buff_row("LCK", "buff_luck",    "de chance",  "LuckBuffEffect"),
+}
+
+@dataclass(slots=True, frozen=True)
 class ResourceModifier:
     """Modifs: HP/SP max: flat + %"""
     hp_max_flat: int = 0
@@ -28,7 +55,7 @@ class ResourceModifier:
     sp_max_flat: int = 0
     sp_max_pct: float = 0.0
     
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StatPercentMod:
     """Modifs: ATK/DEF % appliqués par le moteur"""
     attack_pct: float = 0.0
@@ -38,110 +65,115 @@ class StatPercentMod:
 @dataclass
 class Effect:
     """
-        Base d'effet persistant.
-        Args: name, duration, potency, target
+        Effet persistant, paramétré par données (pas de sous-classe par effet).
+        Args: name, duration, potency, target, kind ("poison" | "buff" | ""), stat_field, delta_sign
     """
     name: str
     duration: int
     potency: int
     target: TargetSide = "target"
-
-    # --- Hooks overridables ---
+    kind: str = ""                  # "" = effet neutre (aucun hook)
+    stat_field: str | None = None   # buffs: champ de Stats modifié (cf. STAT_BUFFS)
+    delta_sign: int = 1
+
+    _caps = 0   # calculé par classe (cf. __init_subclass__) puis par kind (__post_init__), pas un champ
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        caps = getattr(super(cls, cls), "_caps", 0)
+        for name, bit in _CAP_HOOKS:
+            if name in cls.__dict__:
+                caps |= bit
+        cls._caps = caps
+
+    def __post_init__(self):
+        self._caps = type(self)._caps | _KIND_CAPS.get(self.kind, 0)
+
+    @property
+    def cls_name(self) -> str:
+        """Nom stable de l'effet pour les saves/purges (compatible avec les anciennes classes)."""
+        if self.kind == "poison":
+            return "PoisonEffect"
+        if self.kind == "buff" and self.stat_field in STAT_BUFFS:
+            return STAT_BUFFS[self.stat_field][4]
+        return type(self).__name__
+
+    # --- Hooks ---
     def on_hit(self, ctx: CombatContext) -> None:
         pass
 
     def on_apply(self, target: Entity, ctx: CombatContext):
         '''Appelé lors de l'enregistrement sur "target"'''
-        pass
+        if self.kind != "buff":
+            return
+        field = self.stat_field
+        abbr, tag_apply, _, _, _ = STAT_BUFFS[field]
+        target.base_stats = target.base_stats.with_delta(**{field: self.delta_sign * self.potency})
+        ctx.emit(_BUFF_APPLY_TEXT % (target.name, self.potency, abbr), tag_apply, {"amount": self.potency})
 
     def on_turn_end(self, ctx: CombatContext) -> None:
         '''Agit à la fin du tour du porteur'''
-        pass
+        if self.kind == "poison":
+            # Ici : ctx.attacker == porteur (cible qui a l'effet)
+            tick_poisons(ctx.attacker, (self,), ctx.events)
 
     def is_expired(self) -> bool:
         return self.duration <= 0
     
     def on_expire(self, target: Entity, ctx: CombatContext):
         '''Retire les effets réversibles'''
-        pass
+        if self.kind != "buff":
+            return
+        field = self.stat_field
+        _, _, tag_expire, label, _ = STAT_BUFFS[field]
+        target.base_stats = target.base_stats.with_delta(**{field: -self.delta_sign * self.potency})
+        ctx.emit(_BUFF_EXPIRE_TEXT % (label, target.name), tag_expire)
 
     # --- Utilitaire ---
     def tick(self) -> None:
         self.duration -= 1
 
-# --- Liste d'effets ---
-
-class PoisonEffect(Effect):
-    def __init__(self, name: str, duration: int, potency: int):
-        super().__init__(name=name, duration=duration, potency=potency, target="target")
-    
-    def on_turn_end(self, ctx: CombatContext) -> None:
-        if self.is_expired():
-            return
-        
-        # Ici : ctx.attacker == porteur (cible qui a l'effet)
-        taken = ctx.attacker.take_damage(self.potency)
-        ctx.events.append(CombatEvent(
-            text=f"{ctx.attacker.name} subit {taken} dégats de poison.",
-            tag="poison_tick",
+# --- Ticks groupés ---
+
+def tick_poisons(bearer: Entity, poisons, events: list[CombatEvent]) -> None:
+    """Tick de tous les poisons d'un porteur en une boucle (sans dispatch par effet)."""
+    take = bearer.take_damage
+    name = bearer.name
+    append = events.append
+    for e in poisons:
+        d = e.duration
+        if d <= 0:
+            continue
+        taken = take(e.potency)
+        append(_CE(
+            text=_POISON_TEXT % (name, taken),
+            tag=TAG_POISON,
             data={"amount": taken}
         ))
-        self.tick()
-
-class AttackBuffEffect(Effect):
-    def __init__(self, name: str, duration: int, potency: int):
-        super().__init__(name=name, duration=duration, potency=potency, target="self")
-
-    def on_apply(self, target, ctx: CombatContext) -> None:
-        target.base_stats.attack += self.potency
-        ctx.events.append(CombatEvent(
-            text=f"{target.name} gagne +{self.potency} ATK.",
-            tag="buff_attack_apply",
-            data={"amount": self.potency},
-        ))
+        e.duration = d - 1
 
-    def on_expire(self, target, ctx: CombatContext) -> None:
-        target.base_stats.attack -= self.potency
-        ctx.events.append(CombatEvent(
-            text=f"Le buff d'attaque de {target.name} expire.",
-            tag="buff_attack_expire",
-        ))
-    
-class DefenseBuffEffect(Effect):
-    def __init__(self, name: str, duration: int, potency: int):
-        super().__init__(name=name, duration=duration, potency=potency, target="self")
-
-    def on_apply(self, target, ctx: CombatContext) -> None:
-        target.base_stats.defense += self.potency
-        ctx.events.append(CombatEvent(
-            text=f"{target.name} gagne +{self.potency} DEF.",
-            tag="buff_defense_apply",
-            data={"amount": self.potency},
-        ))
+# --- Fabriques d'effets ---
 
-    def on_expire(self, target, ctx: CombatContext) -> None:
-        target.base_stats.defense -= self.potency
-        ctx.events.append(CombatEvent(
-            text=f"Le buff de défense de {target.name} expire.",
-            tag="buff_defense_expire",
-        ))
+def make_poison(name: str, duration: int, potency: int) -> Effect:
+    return Effect(name=name, duration=duration, potency=potency, target="target", kind="poison")
 
-class LuckBuffEffect(Effect):
-    def __init__(self, name: str, duration: int, potency: int):
-        super().__init__(name=name, duration=duration, potency=potency, target="self")
+def make_stat_buff(stat_field: str, name: str, duration: int, potency: int) -> Effect:
+    return Effect(name=name, duration=duration, potency=potency, target="self", kind="buff", stat_field=stat_field)
 
-    def on_apply(self, target, ctx: CombatContext) -> None:
-        target.base_stats.luck += self.potency
-        ctx.events.append(CombatEvent(
-            text=f"{target.name} gagne +{self.potency} LCK.",
-            tag="buff_luck_apply",
-            data={"amount": self.potency},
-        ))
+def make_attack_buff(name: str, duration: int, potency: int) -> Effect:
+    return make_stat_buff("attack", name, duration, potency)
 
-    def on_expire(self, target, ctx: CombatContext) -> None:
-        target.base_stats.luck -= self.potency
-        ctx.events.append(CombatEvent(
-            text=f"Le buff de chance de {target.name} expire.",
-            tag="buff_luck_expire",
-        ))
+def make_defense_buff(name: str, duration: int, potency: int) -> Effect:
+    return make_stat_buff("defense", name, duration, potency)
+
+def make_luck_buff(name: str, duration: int, potency: int) -> Effect:
+    return make_stat_buff("luck", name, duration, potency)
 
+# Constructeurs (name, duration, potency) par nom stable (cf. Effect.cls_name) — saves
+EFFECT_FACTORIES = {
+    "Effect": Effect,
+    "PoisonEffect": make_poison,
+    "AttackBuffEffect": make_attack_buff,
+    "DefenseBuffEffect": make_defense_buff,
+    "LuckBuffEffect": make_luck_buff,
+}
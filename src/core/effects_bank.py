@@ -1,21 +1,26 @@
 from __future__ import annotations
 """Registry d'effets pour les évènements data-driven."""
 
-from core.effects import Effect, AttackBuffEffect, DefenseBuffEffect, LuckBuffEffect, PoisonEffect
+from typing import Callable
+
+from core.effects import Effect, make_attack_buff, make_defense_buff, make_luck_buff, make_poison
+
+# id (minuscules) -> constructeur (duration, potency) -> list[Effect]
+EFFECT_REGISTRY: dict[str, Callable[[int, int], list[Effect]]] = {
+    "blessing_atk": lambda d, p: [make_attack_buff("Bénédiction d'attaque", duration=d, potency=p)],
+    "ward_def": lambda d, p: [make_defense_buff("Protection défensive", duration=d, potency=p)],
+    "luck_up": lambda d, p: [make_luck_buff("Chance accrue", duration=d, potency=p)],
+    "poison": lambda d, p: [make_poison("Poison", duration=d, potency=p)],
+    # alias générique -> buff atk léger par défaut
+    "blessing": lambda d, p: [make_attack_buff("Bénédiction", duration=d, potency=p),
+                              make_defense_buff("Protection défensive", duration=d, potency=p)],
+}
+
 
 def make_effect(effect_id: str, *, duration: int = 0, potency: int = 0) -> list[Effect]:
     effect_id = str(effect_id or "").lower()
-    if effect_id == "blessing_atk":
-        return [AttackBuffEffect("Bénédiction d'attaque", duration=duration, potency=potency)]
-    if effect_id == "ward_def":
-        return [DefenseBuffEffect("Protection défensive", duration=duration, potency=potency)]
-    if effect_id == "luck_up":
-        return [LuckBuffEffect("Chance accrue", duration=duration, potency=potency)]
-    if effect_id == "poison":
-        return [PoisonEffect("Poison", duration=duration, potency=potency)]
-    if effect_id == "blessing":
-        # alias générique -> buff atk léger par défaut
-        return [AttackBuffEffect("Bénédiction", duration=duration, potency=potency), 
-                DefenseBuffEffect("Protection défensive", duration=duration, potency=potency)]
+    ctor = EFFECT_REGISTRY.get(effect_id)
+    if ctor is not None:
+        return ctor(duration, potency)
     # fallback : effet neutre (aucun hook) pour éviter un crash
     return [Effect(name=f"Effet inconnu: {effect_id}", duration=duration, potency=potency)]
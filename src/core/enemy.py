@@ -33,7 +33,8 @@ class Enemy(Entity):
                  behavior: str | None = None):
         super().__init__(name=name, base_stats=base_stats, base_hp_max=base_hp_max, base_sp_max=base_sp_max)
         self.behavior: str | None = behavior  # e.g., "aggressif", "défensif"
-        self.behavior_ai : EnemyBehavior | None = None
+        self._behavior_ai: EnemyBehavior | None = None
+        self._choose = None     # ai.choose lié une fois (cf. behavior_ai.setter)
         self.effect: object | None = None
         self.attacks: list[Attack] | None = None
         self.equipment: EquipmentSet = EquipmentSet(
@@ -42,6 +43,20 @@ class Enemy(Entity):
             artifact=Artifact(name="Malice", durability_max=inf)
         )
 
+    @property
+    def behavior_ai(self) -> EnemyBehavior | None:
+        return self._behavior_ai
+
+    @behavior_ai.setter
+    def behavior_ai(self, ai: EnemyBehavior | None) -> None:
+        self._behavior_ai = ai
+        self._choose = ai.choose if ai is not None else None
+
+    @property
+    def choose_attack(self):
+        """behavior_ai.choose lié (None sans IA), à appeler directement par le contrôleur."""
+        return self._choose
+
     def choose_action(self) -> str:
         """Very simple placeholder AI.
         TODO: Replace with a proper action selection (weights, cooldowns, states).
@@ -54,6 +69,5 @@ class Enemy(Entity):
     # Factory helpers for tests/demo
     @staticmethod
     def training_dummy() -> Enemy:
-        from core.stats import Stats
-        return Enemy(name="Poupée d'entraînement", base_stats=Stats(attack=1, defense=0, speed=0), base_hp_max=30)
+        return Enemy(name="Poupée d'entraînement", base_stats=Stats(attack=1, defense=0, luck=0), base_hp_max=30)
     
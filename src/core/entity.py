@@ -2,11 +2,11 @@ from __future__ import annotations
 """Entity de base: stats + ressources + API métier (dégâts, soins, SP).
 
 - Pas d'I/O ici.
-- Dépend de: core.stats, core.resource
+- Dépend de: core.stats
+- PV/SP sont des entiers portés directement par l'entité (hp/max_hp, sp/max_sp).
 """
 
 from typing import TYPE_CHECKING
-from core.resource import Resource
 
 if TYPE_CHECKING:
     from core.stats import Stats
@@ -15,8 +15,10 @@ if TYPE_CHECKING:
 class Entity:
     """
         Entity de base: stats + ressources + API métier (dégâts, soins, SP)
-        init: name, base_stats, base_hp_max -> hp_res/hp/max_hp, base_sp_max -> sp_res/sp/sp_max
+        init: name, base_stats, base_hp_max -> hp/max_hp, base_sp_max -> sp/max_sp
     """
+    __slots__ = ("name", "base_stats", "hp", "max_hp", "sp", "max_sp", "__weakref__")
+
     def __init__(self, 
                  name: str, 
                  base_stats: Stats, 
@@ -25,35 +27,48 @@ class Entity:
                  ):
         self.name = name
         self.base_stats = base_stats
-        self.hp_res = Resource(current=base_hp_max, maximum=base_hp_max)
-        self.sp_res = Resource(current=base_sp_max, maximum=base_sp_max)
-
-    @property
-    def hp(self): return self.hp_res.current
-    @property
-    def max_hp(self): return self.hp_res.maximum
-    @property
-    def sp(self): return self.sp_res.current
-    @property
-    def max_sp(self): return self.sp_res.maximum
+        self.hp = self.max_hp = base_hp_max
+        self.sp = self.max_sp = base_sp_max
 
     def heal_hp(self, amount: int): 
-        return self.hp_res.add(amount)
+        before = self.hp
+        v = before + amount
+        self.hp = 0 if v < 0 else (self.max_hp if v > self.max_hp else v)
+        return self.hp - before
     def heal_sp(self, amount: int): 
-        return self.sp_res.add(amount)
+        before = self.sp
+        v = before + amount
+        self.sp = 0 if v < 0 else (self.max_sp if v > self.max_sp else v)
+        return self.sp - before
     def restore_all(self):
-        self.hp_res.current = self.hp_res.maximum
-        self.sp_res.current = self.sp_res.maximum
+        self.hp = self.max_hp
+        self.sp = self.max_sp
+
+    # --- maxima (mêmes règles que Resource.set_maximum) ---
+    def set_max_hp(self, new_max: int, preserve_ratio: bool = True):
+        self.hp, self.max_hp = _rescale(self.hp, self.max_hp, new_max, preserve_ratio)
+    def set_max_sp(self, new_max: int, preserve_ratio: bool = True):
+        self.sp, self.max_sp = _rescale(self.sp, self.max_sp, new_max, preserve_ratio)
 
     def take_damage(self, amount: int): 
-        dmg = max(0, int(amount))
-        self.hp_res.remove(dmg)
+        dmg = int(amount)
+        if dmg <= 0:
+            return 0
+        cur = self.hp - dmg
+        self.hp = cur if cur > 0 else 0
+        return dmg
+    def _take_damage_fast(self, dmg: int) -> int:
+        """Chemin interne: `dmg` est déjà un int > 0 (validé par l'appelant)."""
+        cur = self.hp - dmg
+        self.hp = cur if cur > 0 else 0
         return dmg
     def spend_sp(self, cost: int):
-        c = max(0, int(cost))
-        if self.sp_res.current < c: 
+        c = int(cost)
+        if c <= 0:
+            return True
+        if self.sp < c: 
             return False
-        self.sp_res.remove(c) 
+        self.sp -= c
         return True
     
         
@@ -62,3 +77,15 @@ class Entity:
     
     def __str__(self):
         return f"HP : {self.hp}/{self.max_hp}\n" + f"STA : {self.sp}/{self.max_sp}\n" + f"ATK : {self.base_stats.attack}\n" + f"DEF : {self.base_stats.defense}\n" + f"LCK : {self.base_stats.luck}\n"
+
+
+def _rescale(current: int, maximum: int, new_max: int, preserve_ratio: bool) -> tuple[int, int]:
+    """(current, maximum) après changement de max."""
+    if new_max == maximum and current <= maximum:
+        return current, maximum
+    if preserve_ratio and maximum > 0:
+        ratio = current / maximum
+        mx = max(0, new_max)
+        return int(round(mx * ratio)), mx
+    mx = max(0, new_max)
+    return min(current, mx), mx
@@ -8,6 +8,7 @@ Règles:
 
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from math import inf
 
 from core.resource import Resource
 from core.effects import StatPercentMod
@@ -17,6 +18,9 @@ if TYPE_CHECKING:
     from core.combat import CombatContext
 
 
+_NO_PCT = StatPercentMod()   # artefact cassé: aucun bonus %
+
+
 class Equipment:
     '''
         Equipement: equip/un_equip, repair/degrade et gère l'application et le retrait des bonus
@@ -31,6 +35,7 @@ class Equipment:
                 ):
         self.name = name
         self.durability = Resource(current=durability_max, maximum=durability_max)
+        self._unbreakable = (durability_max == inf)   # équipement d'ennemi/de secours: jamais d'usure
         self.description = description
         self._holder = _holder
         self._bonuses_applied = _bonuses_applied    
@@ -38,22 +43,27 @@ class Equipment:
 
     # --- état ---
     def is_broken(self) -> bool:
-        return self.durability.current <= 0
+        return self.durability.current <= 0     # API publique; en interne: lecture directe
 
     @property
     def bonuses_active(self) -> bool:
         """Vrai si les bonus sont effectivement appliqués au porteur."""
-        return (self._holder is not None) and (not self.is_broken()) and self._bonuses_applied
+        return (self._holder is not None) and (self.durability.current > 0) and self._bonuses_applied
     
     @property
     def slot(self) -> str:
         return self._slot
 
+    @property
+    def unbreakable(self) -> bool:
+        """Vrai pour l'équipement sans usure (durabilité infinie)."""
+        return self._unbreakable
+
     # --- cycle de vie d'équipement ---
     def on_equip(self, entity: Entity) -> None:
         """Appelé par Player quand l'objet est équipé."""
         self._holder = entity
-        if not self.is_broken():
+        if self.durability.current > 0:
             self.apply_bonuses(entity)      # bonus appliqué en fonction du type d'équipement
             self._bonuses_applied = True
         else:
@@ -69,7 +79,7 @@ class Equipment:
     # --- (dé)gradation / réparation ---
     def degrade(self, amount: int = 1) -> bool:
         '''Baisse la durabilité. Retourne True si l'objet vient de se casser.'''
-        if amount <= 0 or self.is_broken():
+        if self._unbreakable or amount <= 0 or self.durability.current <= 0:
             return False
         before = self.durability.current
         self.durability.remove(amount)
@@ -82,7 +92,7 @@ class Equipment:
 
     def repair(self, amount: int) -> bool:
         '''Répare. Retourne True si l'objet redevient fonctionnel (0 -> >0)'''
-        if amount <= 0:
+        if self._unbreakable or amount <= 0:
             return False
         before = self.durability.current
         self.durability.add(amount)
@@ -95,9 +105,10 @@ class Equipment:
 
     def set_quality(self, new_max: int, keep_ratio: bool = False) -> None:
         """Change la durabilité max. Réactive/désactive les bonus si on traverse 0."""
-        was_broken = self.is_broken()
+        was_broken = self.durability.current <= 0
         self.durability.set_maximum(new_max=new_max, preserve_ratio=keep_ratio)
-        now_broken = self.is_broken()
+        self._unbreakable = (new_max == inf)    # un max fini rend l'objet cassable
+        now_broken = self.durability.current <= 0
 
         if was_broken and not now_broken:
             # Si redevenu fonctionnel grâce à une hausse de max -> réactive bonus
@@ -122,7 +133,7 @@ class Equipment:
 
     # --- helpers UI/log ---
     def get_info(self) -> str:
-        status = "cassé" if self.is_broken() else "ok"
+        status = "cassé" if self.durability.current <= 0 else "ok"
         return f"{self.name} [{status}] ({self.durability.current}/{self.durability.maximum})"
 
 
@@ -147,11 +158,11 @@ class Weapon(Equipment):
     # --- stat bonuses ---
     def apply_bonuses(self, entity: Entity) -> None:
         """Apply the weapon's stat bonuses to the holder."""
-        entity.base_stats.attack += self.bonus_attack
+        entity.base_stats = entity.base_stats.with_delta(attack=self.bonus_attack)
 
     def remove_bonuses(self, entity: Entity) -> None:
         """Remove the weapon's stat bonuses from the holder."""
-        entity.base_stats.attack -= self.bonus_attack
+        entity.base_stats = entity.base_stats.with_delta(attack=-self.bonus_attack)
 
     # --- usure ---
     def on_after_attack(self, ctx: CombatContext) -> None:
@@ -178,10 +189,10 @@ class Armor(Equipment):
 
     # --- stat bonuses ---
     def apply_bonuses(self, entity: Entity) -> None:
-        entity.base_stats.defense += self.bonus_defense
+        entity.base_stats = entity.base_stats.with_delta(defense=self.bonus_defense)
 
     def remove_bonuses(self, entity: Entity) -> None:
-        entity.base_stats.defense -= self.bonus_defense
+        entity.base_stats = entity.base_stats.with_delta(defense=-self.bonus_defense)
 
     # --- usure ---
     def on_after_hit(self, ctx: CombatContext, damage_taken: int) -> None:
@@ -207,6 +218,8 @@ class Artifact(Equipment):
         self.def_pct = float(def_pct)
         self.lck_pct = float(lck_pct)
         self._slot = "artifact"
+        # % figés à la construction: un seul objet partagé (lecture seule) par artefact
+        self._pct_mod = StatPercentMod(attack_pct=self.atk_pct, defense_pct=self.def_pct, luck_pct=self.lck_pct)
 
     # --- stat bonuses ---
     def apply_bonuses(self, entity: Entity):
@@ -216,17 +229,10 @@ class Artifact(Equipment):
         pass
     
     def stat_percent_mod(self) -> StatPercentMod:
-        if self.is_broken():
-            return StatPercentMod(
-                attack_pct=0.0,
-                defense_pct=0.0,
-                luck_pct=0.0
-            )
-        return StatPercentMod(
-            attack_pct=self.atk_pct,
-            defense_pct=self.def_pct,
-            luck_pct=self.lck_pct
-        )
+        """% actifs (objet partagé, ne pas muter)."""
+        if self.durability.current <= 0:
+            return _NO_PCT
+        return self._pct_mod
 
     def on_turn_end(self, ctx: CombatContext) -> None:
         pass
@@ -9,17 +9,45 @@ from core.equipment import Weapon, Armor, Artifact
 
 Slot = Literal["weapon", "armor", "artifact"]
 
+# Index entiers des slots (accès sans hash de chaîne) + noms dans le même ordre
+SLOT_WEAPON, SLOT_ARMOR, SLOT_ARTIFACT = 0, 1, 2
+SLOT_NAMES: tuple[Slot, ...] = ("weapon", "armor", "artifact")
+
 class EquipmentSet:
+    __slots__ = ("weapon", "armor", "artifact")
+
     def __init__(self, weapon: Weapon, armor: Armor, artifact: Artifact) -> None:
         self.weapon = weapon
         self.armor = armor
         self.artifact = artifact
 
-    def get(self, slot: Slot):
-        return getattr(self, slot)
-
-    def replace(self, slot: Slot, item) -> None:
-        setattr(self, slot, item)
+    def as_tuple(self) -> tuple:
+        """(weapon, armor, artifact) — ordre des SLOT_*."""
+        return (self.weapon, self.armor, self.artifact)
+
+    def get(self, slot: Slot | int):
+        """Accès par nom de slot (API externe) ou par index SLOT_*."""
+        if slot.__class__ is int:
+            return (self.weapon, self.armor, self.artifact)[slot]
+        if slot == "weapon":
+            return self.weapon
+        if slot == "armor":
+            return self.armor
+        if slot == "artifact":
+            return self.artifact
+        raise AttributeError(f"Slot inconnu: {slot!r}")
+
+    def replace(self, slot: Slot | int, item) -> None:
+        if slot.__class__ is int:
+            slot = SLOT_NAMES[slot]
+        if slot == "weapon":
+            self.weapon = item
+        elif slot == "armor":
+            self.armor = item
+        elif slot == "artifact":
+            self.artifact = item
+        else:
+            raise AttributeError(f"Slot inconnu: {slot!r}")
 
 NO_EQUIP = EquipmentSet(
     weapon=Weapon(name="Main nue", durability_max=1, bonus_attack=0, description="Arme de dernier recourt"),
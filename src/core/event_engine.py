@@ -27,38 +27,177 @@ Format JSON attendu (ex. data/events/ruins_altar_01.json):
 }
 """
 
-import json, os, random
-from dataclasses import dataclass
+import hashlib, json, os, pickle, random
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from dataclasses import dataclass, field
 from typing import Any, Callable, Sequence, TYPE_CHECKING
 from pathlib import Path
 
 from core.combat import CombatEvent, CombatContext, CombatResult
-from core.data_paths import default_data_dirs
-from core.effects_bank import make_effect
+from core.data_paths import APP_NAME, default_data_dirs
+from core.data_loader import read_json_cached
+from core.effects_bank import EFFECT_REGISTRY, make_effect
 
 if TYPE_CHECKING:
     from core.player import Player
     from core.effects import Effect
     from core.effect_manager import EffectManager
 
+# Cache des évènements parsés (activé par RUINES_EVENT_CACHE=1)
+_CACHE_ENABLED = os.environ.get("RUINES_EVENT_CACHE", "") not in ("", "0")
+# hors de l'arbre data (suivi par git): même dossier utilisateur que VALIDATION_CACHE_PATH
+_CACHE_DIR = Path.home() / f".{APP_NAME}" / "cache"
+_CACHE_VERSION = 5  # à incrémenter si LoadedEvent/EventOption changent
+
+# Au-delà de ce nombre de fichiers, la lecture disque est faite en parallèle
+_PARALLEL_READ_MIN = 16
+
+
+# Champs numériques des payloads d'effets, convertis en int une seule fois
+_INT_KEYS = ("amount", "amount_pct", "duration", "potency")
+
+
+def _to_int(v: Any) -> Any:
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return v  # laissé tel quel: l'erreur se manifestera à l'application
+
+
+def _norm_effects(effs: Any) -> list[dict]:
+    out: list[dict] = []
+    for eff in effs or ():
+        if isinstance(eff, dict):
+            eff = dict(eff)
+            for k in _INT_KEYS:
+                if k in eff:
+                    eff[k] = _to_int(eff[k])
+        out.append(eff)
+    return out
+
+
+def _norm_requires(reqs: Any) -> list[tuple[str, int | None, int | None]]:
+    out: list[tuple[str, int | None, int | None]] = []
+    for r in reqs or ():
+        gte = r.get("gte")
+        lte = r.get("lte")
+        out.append((
+            str(r.get("stat")),
+            None if gte is None else _to_int(gte),
+            None if lte is None else _to_int(lte),
+        ))
+    return out
+
+
+# Taille de pool à partir de laquelle on tire via une table d'alias (O(1))
+_ALIAS_MIN = 20
+
+
+class _AliasTable:
+    """Table d'alias de Walker/Vose: tirage pondéré en temps constant."""
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights: Sequence[int]) -> None:
+        n = len(weights)
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # les restes (erreurs d'arrondi) gardent prob=1.0
+        self.prob = prob
+        self.alias = alias
+
+    def sample(self, rng: random.Random) -> int:
+        i = rng.randrange(len(self.prob))
+        return i if rng.random() < self.prob[i] else self.alias[i]
+
+
+def _pool_entry(pool: list[LoadedEvent]) -> tuple[list[LoadedEvent], list[int], bool]:
+    """(pool, poids cumulés, poids tous égaux) pour pick_for_zone."""
+    return (pool, list(accumulate(e.weight for e in pool)), len({e.weight for e in pool}) <= 1)
+
+
+# (data_dir, cwd, GAME_DATA_DIR) -> dossier events résolu (None si introuvable)
+_FOLDER_CACHE: dict[tuple[str, str, str | None], Path | None] = {}
+_MISSING = object()
+
+
+def _find_events_folder(data_dir: str) -> Path | None:
+    """Résout le dossier 'events' pour data_dir (mémoïsé: les .is_dir() ne sont faits qu'une fois)."""
+    # data_dir relatif => dépend du CWD; sans data_dir => dépend de GAME_DATA_DIR
+    key = (data_dir, os.getcwd(), os.environ.get("GAME_DATA_DIR"))
+    folder = _FOLDER_CACHE.get(key, _MISSING)
+    if folder is not _MISSING:
+        return folder
+
+    here = Path(__file__).resolve()
+
+    # Candidats possibles selon ta structure:
+    # - data_dir relatif au CWD (ex: lancer depuis la racine)
+    # - data_dir relatif à src/ (là où se trouve event_engine.py)
+    # - data_dir relatif à la racine du repo (src/..)
+    candidates = []
+    if data_dir:
+        candidates += [
+            Path(data_dir),                         # .\data
+            here.parent / data_dir,                # src/core + data -> src/core/data (souvent vide)
+            here.parent.parent / data_dir,         # src/data           ✅
+            here.parent.parent.parent / data_dir,  # racine/data        (si tu déplaces data)
+        ]
+    else:
+        # fallback si aucun data_dir n'est passé : utilise tes chemins par défaut
+        candidates = default_data_dirs()
+
+    folder = None
+    for c in candidates:
+        if (c / "events").is_dir():
+            folder = c / "events"
+            break
+    # (optionnel) debug:
+    # print(f"[DEBUG] EventEngine: folder={folder}")
+    _FOLDER_CACHE[key] = folder
+    return folder
+
+
+def _read_or_none(path: Path) -> Any:
+    # fichier illisible ou JSON invalide (json/orjson.JSONDecodeError ⊂ ValueError) -> ignoré
+    try:
+        return read_json_cached(path)
+    except (OSError, ValueError):
+        return None
+
 # Types légers
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EventOption:
     id: str
     label: str
     raw: dict
+    # Normalisés au parsing (évite les .get/int() à chaque application)
+    requires: list[tuple[str, int | None, int | None]] = field(default_factory=list)
+    effects: list[dict] = field(default_factory=list)
+    on_fail: list[dict] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class LoadedEvent:
     id: str
     text: str
     options: list[EventOption]
-    zone_types: list[str]
+    zone_types: frozenset[str]  # vide => tous biomes
     weight: int
     raw: dict
+    options_by_id: dict[str, EventOption] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EventApplyResult:
     events: list[CombatEvent]
     start_combat: dict | None = None  # ex: {"enemy_id": "mini_boss"} ou {"boss": True}
@@ -71,6 +210,7 @@ class EventEngine:
     - lang    : langue de rendu pour text/labels ("fr" par défaut)
     - effects : EffectManager pour appliquer des effets persistants
     - enemy_factory: callable facultative pour créer un ennemi à partir d'un id (si start_combat)
+    - emit_logs: False pour ne pas produire les CombatEvent de succès (simulation)
     """
 
     def __init__(
@@ -81,13 +221,25 @@ class EventEngine:
         seed: int | None = None,
         effects: EffectManager | None = None,
         enemy_factory: Callable[[dict], Any] | None = None,  # reçoit dict effect {"enemy_id":..., "boss":...}
+        emit_logs: bool = True,
     ) -> None:
         self.lang = lang
+        # False => pas de logs de succès (simulations/tests headless); les échecs restent loggés
+        self._emit_logs = emit_logs
         self.rng = random.Random(seed)
         self.effects = effects
         self.enemy_factory = enemy_factory
         self._events: list[LoadedEvent] = []
+        # zone -> (events compatibles, poids cumulés, poids tous égaux), construit après chargement
+        self._zone_pools: dict[str, tuple[list[LoadedEvent], list[int], bool]] = {}
+        # events sans zone_types (valables partout): pool des zones inconnues
+        self._global_pool: tuple[list[LoadedEvent], list[int], bool] = ([], [], True)
+        # zone -> table d'alias (pools >= _ALIAS_MIN), construite au premier tirage
+        self._alias_by_zone: dict[str, _AliasTable] = {}
+        # nom de zone tel que reçu -> forme normalisée (minuscules)
+        self._zone_norm: dict[str, str] = {}
         self._load_from_dir(data_dir)
+        self._rebuild_pools()
 
     # --------- Chargement ---------
 
@@ -95,78 +247,116 @@ class EventEngine:
         """
         Cherche un dossier 'events' sous plusieurs bases possibles, puis charge tous les JSON.
         """
-        here = Path(__file__).resolve()
-
-        # Candidats possibles selon ta structure:
-        # - data_dir relatif au CWD (ex: lancer depuis la racine)
-        # - data_dir relatif à src/ (là où se trouve event_engine.py)
-        # - data_dir relatif à la racine du repo (src/..)
-        candidates = []
-        if data_dir:
-            candidates += [
-                Path(data_dir),                         # .\data
-                here.parent / data_dir,                # src/core + data -> src/core/data (souvent vide)
-                here.parent.parent / data_dir,         # src/data           ✅
-                here.parent.parent.parent / data_dir,  # racine/data        (si tu déplaces data)
-            ]
-        else:
-            # fallback si aucun data_dir n'est passé : utilise tes chemins par défaut
-            candidates = default_data_dirs()
-
-        base = None
-        for c in candidates:
-            if (c / "events").is_dir():
-                base = c
-                break
-        if base is None:
+        folder = _find_events_folder(data_dir)
+        if folder is None:
             # rien trouvé, on quitte proprement
             return
 
-        folder = base / "events"
-        # (optionnel) debug:
-        # print(f"[DEBUG] EventEngine: folder={folder}")
+        paths = list(folder.glob("*.json"))
+        if not _CACHE_ENABLED:
+            self._parse_files(paths)
+            return
 
-        for path in folder.glob("*.json"):
-            try:
-                raw = json.loads(path.read_text(encoding="utf-8"))
+        # Cache disque (opt-in): évite de re-parser si aucun fichier n'a bougé
+        # un fichier par dossier source (mods / GAME_DATA_DIR / src/data)
+        tag = hashlib.sha1(str(folder.resolve()).encode("utf-8")).hexdigest()[:12]
+        cache_path = _CACHE_DIR / f"events-{tag}.pkl"
+        try:
+            sig = tuple(sorted((p.name, st.st_mtime_ns, st.st_size) for p in paths for st in (p.stat(),)))
+        except OSError:
+            self._parse_files(paths)
+            return
+        key = (_CACHE_VERSION, self.lang, sig)
+        try:
+            with open(cache_path, "rb") as f:
+                cached_key, events = pickle.load(f)
+            if cached_key == key:
+                self._events.extend(events)
+                return
+        except Exception:
+            pass
+
+        self._parse_files(paths)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump((key, self._events), f, protocol=5)
+        except Exception:
+            # dossier en lecture seule, etc. : le cache reste facultatif
+            pass
+
+    def _parse_files(self, paths: Sequence[Path]) -> None:
+        # Lecture (I/O) éventuellement parallèle, parsing des évènements sur le thread principal
+        if len(paths) >= _PARALLEL_READ_MIN:
+            with ThreadPoolExecutor() as ex:
+                raws = list(ex.map(_read_or_none, paths))
+        else:
+            raws = [_read_or_none(p) for p in paths]
 
+        events = self._events
+        for raw in raws:
+            # Formes acceptées, vérifiées explicitement (pas de try/except global)
+            if isinstance(raw, dict) and isinstance(raw.get("events"), list):
                 # Format A: pack par zone { "zone": "...", "events": [...] }
-                if isinstance(raw, dict) and "events" in raw and isinstance(raw["events"], list):
-                    zone_name = str(raw.get("zone", "")).strip().lower()
-                    for ev_raw in raw["events"]:
-                        ev_raw = dict(ev_raw)
-                        if "zone_types" not in ev_raw and zone_name:
-                            ev_raw["zone_types"] = [zone_name]
-                        # ceinture & bretelles : normaliser si déjà présent
-                        if "zone_types" in ev_raw:
-                            ev_raw["zone_types"] = [str(z).strip().lower() for z in ev_raw["zone_types"]]
-                        ev = self._parse_event(ev_raw)
-                        self._events.append(ev)
-                    continue
-
+                zone_name = str(raw.get("zone", "")).strip().lower()
+                ev_raws = []
+                for ev_raw in raw["events"]:
+                    if not isinstance(ev_raw, dict):
+                        continue
+                    ev_raw = dict(ev_raw)
+                    if "zone_types" not in ev_raw and zone_name:
+                        ev_raw["zone_types"] = [zone_name]
+                    # (zone_types est normalisé par _parse_event)
+                    ev_raws.append(ev_raw)
+            elif isinstance(raw, list):
                 # Format B: liste d'events dans le fichier
-                if isinstance(raw, list):
-                    for ev_raw in raw:
-                        ev = self._parse_event(ev_raw)
-                        self._events.append(ev)
-                else:
-                    ev = self._parse_event(raw)
-                    self._events.append(ev)
-
-            except Exception:
-                continue
+                ev_raws = [r for r in raw if isinstance(r, dict)]
+            elif isinstance(raw, dict):
+                # Format C: un event par fichier
+                ev_raws = [raw]
+            else:
+                continue  # fichier illisible/JSON invalide (None) ou forme inconnue
+
+            for ev_raw in ev_raws:
+                try:
+                    events.append(self._parse_event(ev_raw))
+                except (TypeError, ValueError, AttributeError):
+                    # champ mal typé (weight non numérique, option non-objet...): event ignoré
+                    continue
 
     def register_event(self, raw: dict) -> None:
         """Permet d'injecter un évènement (utile en tests)."""
         self._events.append(self._parse_event(raw))
+        self._rebuild_pools()
 
     def _parse_event(self, raw: dict) -> LoadedEvent:
-        text = self._loc(raw.get("text"), self.lang, default="[missing text]")
+        lang = self.lang
+
+        def loc(obj: Any, default: str) -> str:
+            # JSON => dict/str exacts: type() évite le parcours du MRO d'isinstance
+            t = type(obj)
+            if t is dict:
+                return str(obj.get(lang, default))
+            if t is str:
+                return obj
+            return default
+
+        text = loc(raw.get("text"), "[missing text]")
         opts = []
         for o in raw.get("options", []):
-            label = self._loc(o.get("label"), self.lang, default=o.get("id", "?"))
-            opts.append(EventOption(id=o.get("id", "?"), label=label, raw=o))
-        zone_types = [str(z).strip().lower() for z in raw.get("zone_types", [])]
+            label = loc(o.get("label"), o.get("id", "?"))
+            opts.append(EventOption(
+                id=o.get("id", "?"),
+                label=label,
+                raw=o,
+                requires=_norm_requires(o.get("requires")),
+                effects=_norm_effects(o.get("effects")),
+                on_fail=_norm_effects(o.get("on_fail")),
+            ))
+        by_id: dict[str, EventOption] = {}
+        for o in opts:
+            by_id.setdefault(o.id, o)  # en cas de doublon, la première option gagne
+        zone_types = frozenset(str(z).strip().lower() for z in raw.get("zone_types", []))
         weight = int(raw.get("weight", 1))
         return LoadedEvent(
             id=raw.get("id", "event"),
@@ -175,31 +365,48 @@ class EventEngine:
             zone_types=zone_types,
             weight=max(1, weight),
             raw=raw,
+            options_by_id=by_id,
         )
 
-    def _loc(self, obj: Any, lang: str, default: str) -> str:
-        if isinstance(obj, dict):
-            return str(obj.get(lang, default))
-        if isinstance(obj, str):
-            return obj
-        return default
-
     # --------- Sélection ---------
 
+    def _rebuild_pools(self) -> None:
+        """Répartit les events par zone (ordre de chargement conservé) + poids cumulés."""
+        global_pool: list[LoadedEvent] = []
+        by_zone: dict[str, list[LoadedEvent]] = {}
+        for e in self._events:
+            if not e.zone_types:
+                global_pool.append(e)
+                for bucket in by_zone.values():
+                    bucket.append(e)
+                continue
+            for z in e.zone_types:
+                bucket = by_zone.get(z)
+                if bucket is None:
+                    bucket = by_zone[z] = list(global_pool)
+                bucket.append(e)
+        self._zone_pools = {z: _pool_entry(pool) for z, pool in by_zone.items()}
+        self._global_pool = _pool_entry(global_pool)
+        self._alias_by_zone.clear()
+
     def pick_for_zone(self, zone_type: str) -> LoadedEvent | None:
         """Tire un évènement compatible avec le biome, selon weight."""
-        z = str(zone_type).strip().lower() 
-        pool = [e for e in self._events if (not e.zone_types or z in e.zone_types)]
-        if not pool:
-            return None
-        total_w = sum(e.weight for e in pool)
-        r = self.rng.uniform(0, total_w)
-        acc = 0.0
-        for e in pool:
-            acc += e.weight
-            if r <= acc:
-                return e
-        return pool[-1]
+        z = self._zone_norm.get(zone_type)
+        if z is None:
+            z = self._zone_norm[zone_type] = str(zone_type).strip().lower()
+        pool, cum, all_equal = self._zone_pools.get(z, self._global_pool)
+        n = len(pool)
+        if n <= 1:
+            return pool[0] if n else None
+        if all_equal:
+            return self.rng.choice(pool)
+        if n >= _ALIAS_MIN:
+            table = self._alias_by_zone.get(z)
+            if table is None:
+                table = self._alias_by_zone[z] = _AliasTable([e.weight for e in pool])
+            return pool[table.sample(self.rng)]
+        # bisect sur les poids cumulés, fait en C par random.choices
+        return self.rng.choices(pool, cum_weights=cum)[0]
 
     # --------- Application ---------
 
@@ -214,7 +421,7 @@ class EventEngine:
 ) -> EventApplyResult:
         """Applique les effets de l'option (ou on_fail si requirements non remplis)."""
         # 1) Retrouver l’option choisie
-        opt = next((o for o in event.options if o.id == option_id), None)
+        opt = event.options_by_id.get(option_id)
         if opt is None:
             return EventApplyResult(events=[CombatEvent(text="Option invalide.", tag="event_error")])
 
@@ -223,16 +430,16 @@ class EventEngine:
         ctx = CombatContext(attacker=player, defender=None, events=logs)
 
         # 3) Vérifier les prérequis (sinon on_fail)
-        if not self._requirements_met(opt.raw.get("requires", []), player):
-            for eff in opt.raw.get("on_fail", []):
+        if not self._requirements_met(opt.requires, player):
+            for eff in opt.on_fail:
                 self._apply_effect_payload(eff, player, wallet, ctx, extra_ctx)
-            if not opt.raw.get("on_fail"):
+            if not opt.on_fail and self._emit_logs:
                 logs.append(CombatEvent(text="Tu n'as pas les prérequis pour cette option.", tag="event_requires"))
             return EventApplyResult(events=logs)
 
         # 4) Appliquer les effets de l’option
         pending_combat: dict | None = None
-        for eff in opt.raw.get("effects", []):
+        for eff in opt.effects:
             # Cas particulier: déclenchement d’un combat (le GameLoop interprètera)
             if isinstance(eff, dict) and eff.get("type") == "start_combat":
                 # ex: {"enemy_id": "..."} ou {"boss": true}
@@ -245,18 +452,16 @@ class EventEngine:
         return EventApplyResult(events=logs, start_combat=pending_combat)
 
 
-    def _requirements_met(self, reqs: Sequence[dict], player: Any) -> bool:
-        """Actuellement: seuils sur les stats (gte/lte). S'étend facilement (items, or...)."""
-        for r in reqs:
-            stat = r.get("stat")
-            gte = r.get("gte")
-            lte = r.get("lte")
-            val = getattr(getattr(player, "base_stats", player), str(stat), None)
+    def _requirements_met(self, reqs: Sequence[tuple[str, int | None, int | None]], player: Any) -> bool:
+        """Actuellement: seuils sur les stats (gte/lte), pré-normalisés en (stat, gte, lte)."""
+        stats = getattr(player, "base_stats", player)
+        for stat, gte, lte in reqs:
+            val = getattr(stats, stat, None)
             if val is None:
                 return False
-            if gte is not None and not (val >= int(gte)):
+            if gte is not None and not (val >= gte):
                 return False
-            if lte is not None and not (val <= int(lte)):
+            if lte is not None and not (val <= lte):
                 return False
         return True
 
@@ -271,58 +476,87 @@ class EventEngine:
         extra_ctx: dict | None,
     ) -> None:
         t = eff.get("type")
-        if t == "heal_hp":
-            amount = int(eff.get("amount", 0))
-            healed = player.heal_hp(amount)
-            ctx.events.append(CombatEvent(text=f"{player.name} récupère {healed} PV.", tag="heal_hp"))
+        h = self._HANDLERS.get(t)
+        if h is None:
+            self._h_unknown(t, ctx)
             return
-        if t == "heal_hp_pct":
-            pct = int(eff.get("amount_pct", 0))
-            healed = player.heal_hp(int(player.max_hp * pct / 100))
+        h(self, eff, player, wallet, ctx, extra_ctx)
+
+    def _h_unknown(self, t: Any, ctx: CombatContext) -> None:
+        # Inconnu → log
+        ctx.events.append(CombatEvent(text=f"(Effet inconnu ignoré: {t})", tag="event_unknown"))
+
+    def _h_heal_hp(self, eff: dict, player: Player, wallet: Any | None, ctx: CombatContext, extra_ctx: dict | None) -> None:
+        amount = eff.get("amount", 0)
+        healed = player.heal_hp(amount)
+        if self._emit_logs:
+            ctx.events.append(CombatEvent(text=f"{player.name} récupère {healed} PV.", tag="heal_hp"))
+
+    def _h_heal_hp_pct(self, eff: dict, player: Player, wallet: Any | None, ctx: CombatContext, extra_ctx: dict | None) -> None:
+        pct = eff.get("amount_pct", 0)
+        healed = player.heal_hp(int(player.max_hp * pct / 100))
+        if self._emit_logs:
             ctx.events.append(CombatEvent(text=f"{player.name} récupère {healed} PV ({pct}%).", tag="heal_hp_pct"))
-            return
-        if t == "damage_hp":
-            amount = int(eff.get("amount", 0))
-            taken = player.take_damage(amount)
+
+    def _h_damage_hp(self, eff: dict, player: Player, wallet: Any | None, ctx: CombatContext, extra_ctx: dict | None) -> None:
+        amount = eff.get("amount", 0)
+        taken = player.take_damage(amount)
+        if self._emit_logs:
             ctx.events.append(CombatEvent(text=f"{player.name} subit {taken} dégâts.", tag="damage_hp"))
-            return
-        if t == "restore_sp":
-            amount = int(eff.get("amount", 0))
-            got = player.heal_sp(amount)
+
+    def _h_restore_sp(self, eff: dict, player: Player, wallet: Any | None, ctx: CombatContext, extra_ctx: dict | None) -> None:
+        amount = eff.get("amount", 0)
+        got = player.heal_sp(amount)
+        if self._emit_logs:
             ctx.events.append(CombatEvent(text=f"{player.name} récupère {got} SP.", tag="restore_sp"))
+
+    def _h_give_gold(self, eff: dict, player: Player, wallet: Any | None, ctx: CombatContext, extra_ctx: dict | None) -> None:
+        if wallet is None:
+            self._h_unknown(eff.get("type"), ctx)
             return
-        if t == "give_gold" and wallet is not None:
-            amt = int(eff.get("amount", 0))
-            wallet.add(amt)
+        amt = eff.get("amount", 0)
+        wallet.add(amt)
+        if self._emit_logs:
             ctx.events.append(CombatEvent(text=f"+{amt} or.", tag="gold_gain"))
+
+    def _h_take_gold(self, eff: dict, player: Player, wallet: Any | None, ctx: CombatContext, extra_ctx: dict | None) -> None:
+        if wallet is None:
+            self._h_unknown(eff.get("type"), ctx)
             return
-        if t == "take_gold" and wallet is not None:
-            amt = int(eff.get("amount", 0))
-            if wallet.spend(amt):
+        amt = eff.get("amount", 0)
+        if wallet.spend(amt):
+            if self._emit_logs:
                 ctx.events.append(CombatEvent(text=f"-{amt} or.", tag="gold_spend"))
-            else:
-                ctx.events.append(CombatEvent(text=f"Impossible de payer {amt} or.", tag="gold_fail"))
+        else:
+            ctx.events.append(CombatEvent(text=f"Impossible de payer {amt} or.", tag="gold_fail"))
+
+    def _h_apply_effect(self, eff: dict, player: Player, wallet: Any | None, ctx: CombatContext, extra_ctx: dict | None) -> None:
+        if self.effects is None:
+            self._h_unknown(eff.get("type"), ctx)
             return
-        if t == "apply_effect" and self.effects is not None:
-            # Applique un Effect persistant référencé par un registry
-            eff_id = eff.get("effect_id")
-            duration = int(eff.get("duration", 0))
-            potency = int(eff.get("potency", 0))
-            try:
-                new_effs: list[Effect] = make_effect(eff_id, duration=duration, potency=potency)
-            except KeyError:
-                ctx.events.append(CombatEvent(text=f"Échec: effet inconnu '{eff_id}'.", tag="apply_effect_fail"))
-                return
-            if not new_effs:
-                ctx.events.append(CombatEvent(text=f"Échec: effet inconnu '{eff_id}'.", tag="apply_effect_fail"))
-                return
-            
-            for new_eff in new_effs:
-                try:
-                    self.effects.apply(player, new_eff, source_name=f"event:{eff_id}", ctx=ctx, max_stacks=1)
-                    ctx.events.append(CombatEvent(text=f"Effet {new_eff.name} appliqué.", tag="apply_effect"))
-                except Exception:
-                    ctx.events.append(CombatEvent(text=f"Échec: effet inconnu '{eff_id}'.", tag="apply_effect_fail"))
+        # Applique un Effect persistant référencé par un registry
+        eff_id = eff.get("effect_id")
+        duration = eff.get("duration", 0)
+        potency = eff.get("potency", 0)
+        # id hors registry: échec explicite (make_effect retomberait sur un effet neutre)
+        if str(eff_id or "").lower() not in EFFECT_REGISTRY:
+            ctx.events.append(CombatEvent(text=f"Échec: effet inconnu '{eff_id}'.", tag="apply_effect_fail"))
             return
-        # Inconnu → log
-        ctx.events.append(CombatEvent(text=f"(Effet inconnu ignoré: {t})", tag="event_unknown"))
+        new_effs: list[Effect] = make_effect(eff_id, duration=duration, potency=potency)
+
+        # id validé ci-dessus: une erreur ici vient d'un hook on_apply et doit remonter
+        for new_eff in new_effs:
+            self.effects.apply(player, new_eff, source_name=f"event:{eff_id}", ctx=ctx, max_stacks=1)
+            if self._emit_logs:
+                ctx.events.append(CombatEvent(text=f"Effet {new_eff.name} appliqué.", tag="apply_effect"))
+
+    # type d'effet -> handler (fonction non liée: h(self, eff, player, wallet, ctx, extra_ctx))
+    _HANDLERS: dict[str, Callable[..., None]] = {
+        "heal_hp": _h_heal_hp,
+        "heal_hp_pct": _h_heal_hp_pct,
+        "damage_hp": _h_damage_hp,
+        "restore_sp": _h_restore_sp,
+        "give_gold": _h_give_gold,
+        "take_gold": _h_take_gold,
+        "apply_effect": _h_apply_effect,
+    }
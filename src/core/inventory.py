@@ -6,7 +6,7 @@ from __future__ import annotations
 - API pure logique (aucun I/O), pensée pour être appelée depuis GameLoop/IO.
 """
 
-from dataclasses import dataclass
+from array import array
 from typing import TYPE_CHECKING, Literal, TypeAlias
 from core.item import Consumable
 
@@ -18,13 +18,16 @@ if TYPE_CHECKING:
     from core.item import Item
 
 Slot: TypeAlias = Literal["weapon", "armor", "artifact"]
-VALID_SLOT = ("weapon", "armor", "artifact")
+VALID_SLOT = frozenset({"weapon", "armor", "artifact"})
 
 
-@dataclass
-class InventoryStack:
-    item: Item
-    qty: int
+class _StackGroup:
+    """Piles d'un même item_id: une référence Item partagée + quantités contiguës (une case = une pile)."""
+    __slots__ = ("item", "qtys")
+
+    def __init__(self, item: Item) -> None:
+        self.item = item
+        self.qtys: array[int] = array("l")
 
 
 class Inventory:
@@ -32,30 +35,38 @@ class Inventory:
 
     Exemple: capacity=12 → au total 12 piles/équipements combinés.
     """
+    __slots__ = ("capacity", "_stacks", "_equipment", "_slots_used")
 
     def __init__(self, capacity: int = 12) -> None:
         self.capacity: int = max(1, int(capacity))
-        self._stacks: dict[str, list[InventoryStack]] = {}  # item_id -> [stacks...]
-        self._equipment: list[Equipment] = []
+        # item_id -> piles. Invariant: seules la première et la dernière pile peuvent être
+        # non pleines (on retire en tête, on crée en queue, on complète avant de créer)
+        self._stacks: dict[str, _StackGroup] = {}
+        # id(equip) -> equip (Equipment compare par identité; dict ordonné = ordre d'ajout)
+        self._equipment: dict[int, Equipment] = {}
+        # nb de slots occupés (piles + équipements), tenu à jour à chaque ajout/retrait
+        self._slots_used: int = 0
 
     # ---- Introspection / état ----
 
     @property
     def slots_used(self) -> int:
-        return len(self._equipment) + sum(len(v) for v in self._stacks.values())
+        return self._slots_used
 
     @property
     def slots_free(self) -> int:
-        return max(0, self.capacity - self.slots_used)
+        return max(0, self.capacity - self._slots_used)
 
     def list_summary(self) -> list[dict]:
         """Résumé lisible pour l'UI (pas d’I/O ici)."""
-        rows: list[dict] = []
-        for stacks in self._stacks.values():
-            for s in stacks:
-                rows.append({"kind": "item", "id": s.item.item_id, "name": s.item.name, "qty": s.qty})
-        for eq in self._equipment:
-            rows.append({"kind": "equip", "id": getattr(eq, "name", "???"), "name": getattr(eq, "name", "???"), "qty": 1})
+        rows = [
+            {"kind": "item", "id": g.item.item_id, "name": g.item.name, "qty": q}
+            for g in self._stacks.values() for q in g.qtys
+        ]
+        rows += [
+            {"kind": "equip", "id": n, "name": n, "qty": 1}
+            for n in (getattr(eq, "name", "???") for eq in self._equipment.values())
+        ]
         return rows
 
     # ---- Ajout / retrait d'items ----
@@ -71,23 +82,36 @@ class Inventory:
             return 0
 
         added = 0
-        stacks = self._stacks.setdefault(item.item_id, [])
-
-        # 1) Remplir les piles existantes
-        for st in stacks:
-            if st.qty >= item.max_stack:
+        item_id = item.item_id
+        max_stack = item.max_stack
+        free = self.capacity - self._slots_used
+        group = self._stacks.get(item_id)
+        if group is None:
+            if free <= 0:
+                return 0    # inventaire plein et aucune pile existante à compléter
+            group = self._stacks[item_id] = _StackGroup(item)
+        qtys = group.qtys
+
+        # 1) Remplir les piles existantes (seules la première et la dernière peuvent avoir de la place)
+        n = len(qtys)
+        for i in ((0, n - 1) if n > 1 else range(n)):
+            q = qtys[i]
+            if q >= max_stack:
                 continue
-            can = min(item.max_stack - st.qty, qty - added)
-            st.qty += can
+            can = min(max_stack - q, qty - added)
+            qtys[i] = q + can
             added += can
             if added >= qty:
                 return added
 
         # 2) Créer de nouvelles piles si slots disponibles
-        while added < qty and self.slots_free > 0:
-            take = min(item.max_stack, qty - added)
-            stacks.append(InventoryStack(item=item, qty=take))
+        created = 0
+        while added < qty and created < free:
+            take = min(max_stack, qty - added)
+            qtys.append(take)
+            created += 1
             added += take
+        self._slots_used += created
 
         return added
 
@@ -97,53 +121,57 @@ class Inventory:
         if qty == 0:
             return 0
         removed = 0
-        stacks = self._stacks.get(item_id, [])
-        i = 0
-        while i < len(stacks) and removed < qty:
-            take = min(stacks[i].qty, qty - removed)
-            stacks[i].qty -= take
+        group = self._stacks.get(item_id)
+        if group is None:
+            return 0
+        qtys = group.qtys
+        # on retire toujours en tête
+        while qtys and removed < qty:
+            q = qtys[0]
+            take = min(q, qty - removed)
             removed += take
-            if stacks[i].qty <= 0:
-                stacks.pop(i)
-                continue
-            i += 1
-        if not stacks and item_id in self._stacks:
+            if take == q:
+                del qtys[0]
+                self._slots_used -= 1
+            else:
+                qtys[0] = q - take
+        if not qtys:
             del self._stacks[item_id]
         return removed
 
     def count(self, item_id: str) -> int:
         """Quantité totale d'un item stackable (toutes piles confondues)."""
-        return sum(st.qty for st in self._stacks.get(item_id, []))
+        group = self._stacks.get(item_id)
+        return sum(group.qtys) if group is not None else 0
 
     # ---- Équipements ----
 
     def add_equipment(self, equip: Equipment) -> bool:
-        """Ajoute un équipement (1 slot)."""
-        if self.slots_free <= 0:
+        """Ajoute un équipement (1 slot). Le même objet ne peut pas être stocké deux fois."""
+        if self.slots_free <= 0 or id(equip) in self._equipment:
             return False
-        self._equipment.append(equip)
+        self._equipment[id(equip)] = equip
+        self._slots_used += 1
         return True
 
     def remove_equipment(self, equip: Equipment) -> bool:
         """Retire un équipement s'il est présent."""
-        try:
-            self._equipment.remove(equip)
-            return True
-        except ValueError:
+        if self._equipment.pop(id(equip), None) is None:
             return False
+        self._slots_used -= 1
+        return True
 
     def list_equipment(self) -> list[Equipment]:
-        return list(self._equipment)
+        return list(self._equipment.values())
 
     # ---- Utilisation de consommables ----
 
     def use_consumable(self, item_id: str, user: Entity, ctx: CombatContext | None = None) -> list[CombatEvent]:
         """Utilise 1 unité d'un consommable si disponible. Retourne les events générés."""
-        stacks = self._stacks.get(item_id, [])
-        if not stacks:
+        group = self._stacks.get(item_id)
+        if group is None or not group.qtys:
             return []
-        stack = stacks[0]
-        item = stack.item
+        item = group.item
         if not isinstance(item, Consumable):
             return []
 
@@ -162,7 +190,7 @@ class Inventory:
         slot = equip._slot
         if slot not in VALID_SLOT:
             raise ValueError(f"slot invalide {slot}")  
-        if equip not in self._equipment:
+        if id(equip) not in self._equipment:
             return False
 
         current = getattr(owner, slot, None)
@@ -200,13 +228,13 @@ class Inventory:
         Retourne (ok, message).
         """
 
-        eqs: list[Equipment] = getattr(self, "_equipment", []) or []
+        eqs = self._equipment
         if index < 0 or index >= len(eqs):
             return (False, "Index hors limites.")
 
-        item = eqs.pop(index)
+        item = list(eqs.values())[index]
         slot = item._slot
-        if slot not in ("weapon", "armor", "artifact"):
+        if slot not in VALID_SLOT:
             return (False, f"Slot invalide: {slot}")
         
         # Récupérer l'ancien
@@ -215,22 +243,19 @@ class Inventory:
         except Exception:
             current = getattr(getattr(owner, "equipment", None), slot, None)
 
-        # Vérifier la place si on doit récupérer l'ancien
-        if current is not None and current is not getattr(owner.equipment, slot, None):
-            # (ce cas ne devrait pas arriver)
-            pass
-        if current is not None and self.slots_free <= 0:
-            # On remet l'item sélectionné et on annule
-            eqs.insert(index, item)
+        # Vérifier la place si on doit récupérer l'ancien (le slot de l'item sélectionné sera libéré)
+        if current is not None and self.capacity - (self._slots_used - 1) <= 0:
             return (False, "Pas assez de place pour récupérer l'ancien équipement.")
 
+        del eqs[id(item)]
+        self._slots_used -= 1
+
         # Équiper via Player (applique les bonus)
         owner.equip(item)
 
         # Remettre l'ancien dans l'inventaire
         if current is not None:
-            eqs.append(current)
+            eqs[id(current)] = current
+            self._slots_used += 1
 
-        setattr(self, "_equipment", eqs)  # réécrit la liste
         return (True, f"{slot}: {getattr(item, 'name', '???')}")
-
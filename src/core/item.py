@@ -1,8 +1,9 @@
 from __future__ import annotations
 """Base des items du jeu (agnostique de l'affichage)."""
 
+import sys
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, TypeAlias, Literal
+from typing import TYPE_CHECKING, Callable, TypeAlias, Literal
 
 from core.combat import CombatEvent, CombatContext
 if TYPE_CHECKING:
@@ -10,7 +11,7 @@ if TYPE_CHECKING:
 
 
 Slot: TypeAlias = Literal["recovery", "boost", "equipment"]
-VALID_SLOT = ("recovery", "boost", "equipment")
+VALID_SLOT = frozenset({"recovery", "boost", "equipment"})
 
 @dataclass
 class Item:
@@ -30,20 +31,46 @@ class Item:
     stackable: bool = True
     max_stack: int = 99
 
+    def __post_init__(self) -> None:
+        # id interné: les clés de Inventory._stacks se comparent par pointeur
+        if type(self.item_id) is str:
+            self.item_id = sys.intern(self.item_id)
+
+
+# Flyweight: une instance partagée par item_id pour les items stackables (sans état propre)
+_ITEM_POOL: dict[str, Item] = {}
+
+
+def get_item(item_id: str, factory: Callable[[], Item]) -> Item:
+    """Retourne l'instance partagée de item_id, construite par factory au premier appel."""
+    it = _ITEM_POOL.get(item_id)
+    if it is None:
+        it = _ITEM_POOL[item_id] = factory()
+    return it
+
+
+def forget_item(item_id: str) -> None:
+    """Retire item_id du pool (ex: définition rechargée depuis le JSON)."""
+    _ITEM_POOL.pop(item_id, None)
+
+
+# kind -> (texte, tag) de l'event générique renvoyé par Consumable.on_use
+_USE_EVENTS: dict[str, tuple[str, str]] = {
+    "recovery": ("Vous vous rétablissez", "recovery_use"),
+    "boost": ("Vous vous boostez", "boost_use"),
+    "equipment": ("Vous munissez d'equipement", "equip_use"),
+}
+
 
 class Consumable(Item):
     """Consommable basique (ex: potion). Définit un hook on_use(user, ctx)."""
 
     def __init__(self, kind: Slot, item_id: str, name: str, description: str = "", *, max_stack: int = 99) -> None:
+        if kind not in VALID_SLOT:
+            raise ValueError(f"kind invalide {kind}")
         super().__init__(item_id=item_id, kind=kind, name=name, description=description, stackable=True, max_stack=max_stack)
 
     def on_use(self, user: Entity, ctx: CombatContext | None = None) -> list[CombatEvent]:
         """Applique l'effet et renvoie des events (peut être vide)."""
-        if self.kind not in VALID_SLOT:
-            raise ValueError(f"kind invalide {self.kind}")  
-        elif self.kind == "recovery":
-            return [CombatEvent(text="Vous vous rétablissez", tag="recovery_use", data={"item": self.item_id})]
-        elif self.kind == "boost":
-            return [CombatEvent(text="Vous vous boostez", tag="boost_use", data={"item": self.item_id})]
-        elif self.kind == "equipment":
-            return [CombatEvent(text="Vous munissez d'equipement", tag="equip_use", data={"item": self.item_id})]
+        text, tag = _USE_EVENTS[self.kind]  # kind validé à la construction
+        return [CombatEvent(text=text, tag=tag, data={"item": self.item_id})]
@@ -1,16 +1,25 @@
 from __future__ import annotations
 """Loadout d'actions: 3 emplacements (primaire, compétence, utilitaire)."""
 
+from copy import copy
 from dataclasses import dataclass
 from typing import Literal, TypeAlias, TYPE_CHECKING
-from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from core.attack import Attack
     from core.entity import Entity
 
 Slot: TypeAlias = Literal["primary", "skill", "utility"]
-VALID_SLOT = ("primary", "skill", "utility")
+VALID_SLOT = frozenset({"primary", "skill", "utility"})
+
+
+def _copy_attack(a: "Attack | None") -> "Attack | None":
+    """Copie superficielle d'une Attack + sa liste d'effets (pas de re-validation __init__)."""
+    if a is None:
+        return None
+    new = copy(a)  # garde aussi les attributs posés après coup (ex: deals_damage)
+    new.effects = list(a.effects)
+    return new
 
 
 @dataclass(slots=True, kw_only=True)
@@ -22,20 +31,21 @@ class Loadout:
     def as_list(self) -> list[Attack]:
         return [self.primary, self.skill, self.utility]
 
+    def __iter__(self):
+        yield self.primary
+        yield self.skill
+        yield self.utility
+
     def replace(self, slot: Slot, attack: Attack) -> None:
         if slot not in VALID_SLOT:
             raise ValueError(f"slot invalide {slot}")    
         setattr(self, slot, attack)
         
     def clone(self) -> "Loadout":
-        # copie défensive : reconstruit de nouvelles Attack
-        def _copy(a: "Attack") -> "Attack":
-            # On évite deepcopy; Attack(**vars(a)) suffit si Attack est “plat”
-            from core.attack import Attack
-            return Attack(**vars(a))
-        return Loadout(primary=_copy(self.primary),
-                       skill=_copy(self.skill),
-                       utility=_copy(self.utility))
+        # copie défensive : nouvelles Attack (copy superficielle, listes d'effets copiées)
+        return Loadout(primary=_copy_attack(self.primary),
+                       skill=_copy_attack(self.skill),
+                       utility=_copy_attack(self.utility))
 
     def set_skill(self, attack: "Attack") -> None:
         self.skill = attack
@@ -46,12 +56,19 @@ class Loadout:
         return lo 
 
 class LoadoutManager:
-    """Associe un Loadout à une entité sans modifier Player/Entity."""
+    """Associe un Loadout à une entité sans modifier Player/Entity.
+
+    Indexé par id(entity) (comme EffectManager): appeler drop() quand l'entité quitte le jeu.
+    """
     def __init__(self) -> None:
-        self._by_entity: WeakKeyDictionary["Entity", Loadout] = WeakKeyDictionary()
+        self._by_id: dict[int, Loadout] = {}
 
     def set(self, entity: "Entity", loadout: Loadout) -> None:
-        self._by_entity[entity] = loadout
+        self._by_id[id(entity)] = loadout
 
     def get(self, entity: "Entity") -> Loadout | None:
-        return self._by_entity.get(entity)
\ No newline at end of file
+        return self._by_id.get(id(entity))
+
+    def drop(self, entity: "Entity") -> None:
+        """Oublie le loadout d'une entité."""
+        self._by_id.pop(id(entity), None)
@@ -6,25 +6,35 @@ from __future__ import annotations
 - Dépend de  core.entity, core.stats, core.player_classes
 """
 
+import sys
 from typing import TYPE_CHECKING, Literal, TypeAlias
 
 from core.entity import Entity
 from core.player_class import PlayerClass
 from core.data_loader import load_player_classes
-from core.equipment_set import EquipmentSet, NO_EQUIP
+from core.equipment_set import EquipmentSet, NO_EQUIP, SLOT_NAMES
 
 if TYPE_CHECKING:
     from core.equipment import Equipment, Weapon, Armor, Artifact
     from core.stats import Stats
 
 Slot: TypeAlias = Literal["weapon", "armor", "artifact"]
-VALID_SLOT = ("weapon", "armor", "artifact")
+VALID_SLOT = frozenset({"weapon", "armor", "artifact"})
+
+# slot -> descripteur __slots__ d'EquipmentSet (accès direct __get__/__set__, sans getattr par nom).
+# Un slot absent du dict est invalide: la validation et l'accès se font en une seule lecture.
+_SLOT_ACCESS = {name: getattr(EquipmentSet, name) for name in SLOT_NAMES}
+# slot -> équipement "vide" de NO_EQUIP, résolu une fois à l'import
+_NO_EQUIP_BY_SLOT = {name: getattr(NO_EQUIP, name) for name in SLOT_NAMES}
 
 class Player(Entity):
     """
         Entité jouable
         init: name, player_class_key, base_stats, base
     """
+    # class_attack: posé seulement si la classe en a une (lu via getattr(..., None))
+    __slots__ = ("equipment", "player_class_key", "player_class", "class_attack_unlocked", "class_attack")
+
     def __init__(self, 
                  name: str, 
                  player_class_key: str, 
@@ -37,13 +47,13 @@ class Player(Entity):
         self.equipment: EquipmentSet = EquipmentSet(weapon=NO_EQUIP.weapon, armor=NO_EQUIP.armor, artifact=NO_EQUIP.artifact)
 
         # Applique bonus de classe (stats + resources + equip) if provided
-        self.player_class_key = (player_class_key or "").strip().lower()
-        _classes = load_player_classes()
+        key = self.player_class_key = sys.intern((player_class_key or "").strip().lower())
         try:
-            self.player_class: PlayerClass = _classes[self.player_class_key]
+            pc: PlayerClass = load_player_classes()[key]
         except KeyError:
-            raise KeyError(f"Classe inconnue: {self.player_class_key}")
-        self.player_class.apply_to(self)
+            raise KeyError(f"Classe inconnue: {key}")
+        self.player_class = pc
+        pc.apply_to(self)
         self.class_attack_unlocked: bool = False
 
 
@@ -54,37 +64,45 @@ class Player(Entity):
         """Equipe un item dans le bon slot du set"""
         # Vérifie que c'est le bon slot
         slot = new_item._slot
-        if slot not in VALID_SLOT:
+        acc = _SLOT_ACCESS.get(slot)
+        if acc is None:
             raise ValueError(f"slot invalid {slot}")
         # Vérifie que l'item n'a pas de holder
-        current_holder: "Player" | None = getattr(new_item, "_holder", None)
+        current_holder: "Player" | None = new_item._holder
         if current_holder and current_holder is not self:
             new_item.on_unequip(current_holder)
         # On unequip l'item présent, equip le nouvel item et actualise le set
-        current_item: "Equipment" = getattr(self.equipment, slot, None)
+        eq = self.equipment
+        current_item: "Equipment" = acc.__get__(eq)
         current_item.on_unequip(self)
         new_item.on_equip(self)
-        self.equipment.replace(slot=slot, item=new_item)
+        acc.__set__(eq, new_item)
+
+    def equip_set(self, equip_set: EquipmentSet) -> None:
+        """Equipe les pièces d'un set en un appel (ordre des SLOT_*)."""
+        equip = self.equip
+        for item in equip_set.as_tuple():
+            equip(item)
 
     def unequip(self, slot: Slot) -> None:
         # Vérifie le bon slot
-        if slot not in VALID_SLOT:
+        acc = _SLOT_ACCESS.get(slot)
+        if acc is None:
             raise ValueError(f"slot invalide {slot}") 
-        item: "Equipment" = self.equipment.get(slot)
+        eq = self.equipment
+        item: "Equipment" = acc.__get__(eq)
         item.on_unequip(self)
-        no_equip : "Equipment" = getattr(NO_EQUIP, slot, None)
+        no_equip : "Equipment" = _NO_EQUIP_BY_SLOT[slot]
         no_equip.on_equip(self)
-        self.equipment.replace(slot=slot, item=no_equip)
+        acc.__set__(eq, no_equip)
             
 
     def print_equipment(self) -> None:
         # Console helper (safe no-op for other UIs)
-        w = self.equipment.weapon
-        a = self.equipment.armor
-        r = self.equipment.artifact
-        print("Équipement actuel :")
-        print(f"  Arme     : {w.name} ({w.description})")
-        print(f"  Armure   : {a.name} ({a.description})")
-        print(f"  Artefact : {r.name} ({r.description})")
+        w, a, r = self.equipment.as_tuple()
+        print("Équipement actuel :\n"
+              f"  Arme     : {w.name} ({w.description})\n"
+              f"  Armure   : {a.name} ({a.description})\n"
+              f"  Artefact : {r.name} ({r.description})")
 
 
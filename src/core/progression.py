@@ -1,12 +1,21 @@
 """Tier progression & soft-pity utilities."""
 
-from dataclasses import dataclass
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from typing import Tuple
 import math
 import random
 from core.utils import clamp, normalize
 
-PhaseWeights = dict[int, float]
+PhaseWeights = tuple[tuple[int, float], ...]     # ((offset, proba), ...)
+
+# Tableau EXACT (ton image) : une ligne par phase 1..4 (index = phase - 1)
+_DEFAULT_PHASE_TABLE: tuple[PhaseWeights, ...] = (
+    ((-1, 0.25), (0, 0.60), (+1, 0.10), (+2, 0.05)),
+    ((-1, 0.20), (0, 0.55), (+1, 0.18), (+2, 0.07)),
+    ((-1, 0.10), (0, 0.45), (+1, 0.35), (+2, 0.10)),
+    ((-1, 0.05), (0, 0.25), (+1, 0.60), (+2, 0.10)),
+)
 
 @dataclass
 class TierProgression:
@@ -18,17 +27,16 @@ class TierProgression:
     # cap campagne (T6 réservé aux events)
     campaign_max_tier: int = 5
 
-    # Tableau EXACT (ton image) : par phase 1..4
-    PHASE_TABLE: dict[int, PhaseWeights] = None
+    # lignes par phase (index = phase - 1); None -> _DEFAULT_PHASE_TABLE
+    PHASE_TABLE: tuple[PhaseWeights, ...] = None
+
+    # (level, max_tier, pity) -> (tiers triés, probas cumulées); PHASE_TABLE est figé après init
+    _cum_cache: dict[tuple[int, int | None, bool], tuple[tuple[int, ...], tuple[float, ...]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.PHASE_TABLE is None:
-            self.PHASE_TABLE = {
-                1: {-1: 0.25, 0: 0.60, +1: 0.10, +2: 0.05},
-                2: {-1: 0.20, 0: 0.55, +1: 0.18, +2: 0.07},
-                3: {-1: 0.10, 0: 0.45, +1: 0.35, +2: 0.10},
-                4: {-1: 0.05, 0: 0.25, +1: 0.60, +2: 0.10},
-            }
+            self.PHASE_TABLE = _DEFAULT_PHASE_TABLE
 
     # ---------- helpers ----------
     def tier_for_level(self, level: int) -> int:
@@ -44,12 +52,14 @@ class TierProgression:
         if max_tier is None:
             max_tier = self.campaign_max_tier
         T = self.tier_for_level(level)
-        rel = self.PHASE_TABLE.get(self.phase_index(level), self.PHASE_TABLE[1])
+        table = self.PHASE_TABLE
+        i = self.phase_index(level) - 1
+        rel = table[i] if i < len(table) else table[0]
 
         # on mappe offsets -> tiers; tout ce qui <1 est absorbé en T1;
         # >max_tier absorbé en max_tier; puis on renormalise.
         acc: dict[int, float] = {}
-        for off, p in rel.items():
+        for off, p in rel:
             t = clamp(T + off, 1, max_tier)
             acc[t] = acc.get(t, 0.0) + p
         return normalize(acc)
@@ -69,15 +79,24 @@ class TierProgression:
     def choose_tier_with_pity(self, rng: random.Random, level: int,
                               max_tier: int | None = None,
                               fights_since_good: int = 0) -> int:
+        pity = self.should_force_high_tier(fights_since_good)
+        key = (level, max_tier, pity)
+        entry = self._cum_cache.get(key)
+        if entry is None:
+            entry = self._cum_cache[key] = self._cumulative(level, max_tier, pity)
+        tiers, cum = entry
+        i = bisect_left(cum, rng.random())     # premier cumul >= x
+        return tiers[i] if i < len(tiers) else tiers[-1]
+
+    def _cumulative(self, level: int, max_tier: int | None, pity: bool) -> tuple[tuple[int, ...], tuple[float, ...]]:
         w = self.weights(level, max_tier)
-        if self.should_force_high_tier(fights_since_good):
+        if pity:
             T = self.tier_for_level(level)
             w = {t: p for (t, p) in w.items() if t >= max(T, self.pity_min_tier)}
             w = normalize(w)
         tiers, probs = zip(*sorted(w.items()))
-        x, acc = rng.random(), 0.0
-        for t, p in zip(tiers, probs):
+        cum, acc = [], 0.0
+        for p in probs:
             acc += p
-            if x <= acc:
-                return t
-        return tiers[-1]
+            cum.append(acc)
+        return tiers, tuple(cum)
@@ -1,12 +1,11 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
-from core.utils import clamp
 
 if TYPE_CHECKING:
     from core.entity import Entity
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceMaxMods:
     hp_max_pct: float = 0.0
     hp_max_flat: int = 0
@@ -25,15 +24,21 @@ class Resource:
 
     def add(self, amount: int):
         before = self.current
-        self.current = clamp(self.current +  amount, 0, self.maximum)
-        return self.current - before
+        v = before + amount
+        v = 0 if v < 0 else (self.maximum if v > self.maximum else v)
+        self.current = v
+        return v - before
     
     def remove(self, amount: int):
         before = self.current
-        self.current = clamp(self.current -  amount, 0, self.maximum)
-        return before - self.current
+        v = before - amount
+        v = 0 if v < 0 else (self.maximum if v > self.maximum else v)
+        self.current = v
+        return before - v
     
     def set_maximum(self, new_max: int, preserve_ratio: bool = True):
+        if new_max == self.maximum and self.current <= new_max:
+            return      # max inchangé: rien à recalculer
         if preserve_ratio and self.maximum > 0:
             ratio = self.current / self.maximum
             self.maximum = max(0, new_max)
@@ -43,13 +48,16 @@ class Resource:
             self.current = min(self.current, self.maximum)
 
 def apply_max_mods(entity: "Entity", mods: list[ResourceMaxMods], preserve_ratio: bool = True):
-    hp_pct  = sum(m.hp_max_pct for m in mods)
-    hp_flat = sum(m.hp_max_flat for m in mods)
-    sp_pct  = sum(m.sp_max_pct for m in mods)
-    sp_flat = sum(m.sp_max_flat for m in mods)
-
-    new_hp_max = int(round(entity.hp_res.maximum * (1.0 + hp_pct))) + hp_flat
-    new_sp_max = int(round(entity.sp_res.maximum * (1.0 + sp_pct))) + sp_flat
-
-    entity.hp_res.set_maximum(new_hp_max, preserve_ratio=preserve_ratio)
-    entity.sp_res.set_maximum(new_sp_max, preserve_ratio=preserve_ratio)
\ No newline at end of file
+    hp_pct = sp_pct = 0.0
+    hp_flat = sp_flat = 0
+    for m in mods:      # une seule passe pour les quatre sommes
+        hp_pct  += m.hp_max_pct
+        hp_flat += m.hp_max_flat
+        sp_pct  += m.sp_max_pct
+        sp_flat += m.sp_max_flat
+
+    new_hp_max = int(round(entity.max_hp * (1.0 + hp_pct))) + hp_flat
+    new_sp_max = int(round(entity.max_sp * (1.0 + sp_pct))) + sp_flat
+
+    entity.set_max_hp(new_hp_max, preserve_ratio=preserve_ratio)
+    entity.set_max_sp(new_sp_max, preserve_ratio=preserve_ratio)
\ No newline at end of file
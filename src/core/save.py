@@ -23,21 +23,19 @@ Remarques:
 
 import json
 from typing import TYPE_CHECKING
-import inspect
+
+try:  # sérialiseur JSON plus rapide si disponible (repli: json stdlib)
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
 
 # ——— Imports moteur ———
-from core import effects
 from core.player import Player
 from core.attack import Attack
 from core.resource import Resource
 from core.inventory import Inventory
 from core.supply import Wallet
-from core.effects import Effect, PoisonEffect, AttackBuffEffect, DefenseBuffEffect, LuckBuffEffect
-_EFFECT_REGISTRY = {
-    name: cls
-    for name, cls in inspect.getmembers(effects, inspect.isclass)
-    if issubclass(cls, Effect)
-}
+from core.effects import Effect, EFFECT_FACTORIES as _EFFECT_REGISTRY
 from core.effects_bank import make_effect
 from core.loadout import Loadout, LoadoutManager
 from core.equipment import Weapon, Armor, Artifact, Equipment
@@ -60,15 +58,36 @@ SAVE_VERSION = 1
 
 # --------------------- utilitaires ---------------------
 
+def _dumps(obj) -> bytes:
+    """JSON indenté (2) en UTF-8, via orjson si présent."""
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _loads(raw: bytes):
+    return (_orjson or json).loads(raw)
+
+def _rng_state_to_json(st: tuple) -> list:
+    """random.getstate() = (version, 625 ints, gauss_next) -> [version, [ints], gauss_next]."""
+    version, internal, gauss_next = st
+    return [version, list(internal), gauss_next]
+
+def _rng_state_from_json(row: list) -> tuple:
+    version, internal, gauss_next = row
+    # anciennes saves: gauss_next stocké en str ("None" ou repr du float)
+    if isinstance(gauss_next, str):
+        gauss_next = None if gauss_next == "None" else float(gauss_next)
+    return (version, tuple(internal), gauss_next)
+
 def _attack_to_dict(atk: Attack) -> dict:
     d = {
         "name": atk.name,
         "base_damage": atk.base_damage,
         "variance": atk.variance,
         "cost": atk.cost,
-        "crit_multiplier": getattr(atk, "crit_multiplier", 2.0),
-        "ignore_defense_pct": getattr(atk, "ignore_defense_pct", 0.0),
-        "true_damage": getattr(atk, "true_damage", 0),
+        "crit_multiplier": atk.crit_multiplier,
+        "ignore_defense_pct": atk.ignore_defense_pct,
+        "true_damage": atk.true_damage,
     }
     # Effets (facultatif): si l'attaque porte des effets instanciés, on les réduit à effect_id/potency/duration
     if atk.effects:
@@ -82,82 +101,88 @@ def _attack_to_dict(atk: Attack) -> dict:
             })
         if effs:
             d["effects"] = effs
-        # Cible (si tu as ajouté ce champ): "self"/"enemy"
-        if hasattr(atk, "target"):
-            d["target"] = getattr(atk, "target")
+        # Cible: "self"/"enemy"
+        d["target"] = atk.target
     return d
 
+# (clé, cast, défaut) des champs scalaires d'Attack, résolus une fois à l'import
+_ATTACK_FIELDS = (
+    ("base_damage", int, 0),
+    ("variance", int, 0),
+    ("cost", int, 0),
+    ("crit_multiplier", float, 2.0),
+    ("ignore_defense_pct", float, 0.0),
+    ("true_damage", int, 0),
+)
+
 def _attack_from_dict(d: dict) -> Attack:
     # Reconstitue l'attaque (effets via effects_bank)
     effs = []
     for e in d.get("effects", []) or []:
         effs.append(make_effect(e.get("effect_id"), duration=int(e.get("duration", 0)), potency=int(e.get("potency", 0))))
-    return Attack(
-        name=d.get("name", "Attaque"),
-        base_damage=int(d.get("base_damage", 0)),
-        variance=int(d.get("variance", 0)),
-        cost=int(d.get("cost", 0)),
-        crit_multiplier=float(d.get("crit_multiplier", 2.0)),
-        ignore_defense_pct=float(d.get("ignore_defense_pct", 0.0)),
-        true_damage=int(d.get("true_damage", 0)),
-        effects=effs,
-        **({"target": d["target"]} if "target" in d else {})
-    )
+    kwargs = {k: cast(d.get(k, dflt)) for k, cast, dflt in _ATTACK_FIELDS}
+    if "target" in d:
+        kwargs["target"] = d["target"]
+    return Attack(name=d.get("name", "Attaque"), effects=effs, **kwargs)
+
+
+def _enc_weapon(obj: Weapon, base: dict) -> None:
+    base.update({"kind": obj._slot, "bonus_attack": int(obj.bonus_attack)})
+
+def _enc_armor(obj: Armor, base: dict) -> None:
+    base.update({"kind": obj._slot, "bonus_defense": obj.bonus_defense})
+
+def _enc_artifact(obj: Artifact, base: dict) -> None:
+    spm = obj.stat_percent_mod()
+    base.update({"kind": obj._slot, "atk_pct": spm.attack_pct, "def_pct": spm.defense_pct, "lck_pct": spm.luck_pct})
 
+# type concret -> champs spécifiques (pas de sous-classes d'équipement: lookup exact sur type())
+_EQ_ENCODERS = {Weapon: _enc_weapon, Armor: _enc_armor, Artifact: _enc_artifact}
 
 def _equipment_slot_to_dict(slot_obj: Equipment) -> dict | None:
     if slot_obj is None:
         return None
+    dur = slot_obj.durability
     base = {
-        "name": getattr(slot_obj, "name", "???"),
+        "name": slot_obj.name,
         "durability": {
-            "current": slot_obj.durability.current,
-            "maximum": slot_obj.durability.maximum,
+            "current": dur.current,
+            "maximum": dur.maximum,
         }
     }
-    if isinstance(slot_obj, Weapon):
-        base.update({
-            "kind": slot_obj._slot,
-            "bonus_attack": int(getattr(slot_obj, "bonus_attack", 0)),
-        })
-    elif isinstance(slot_obj, Armor):
-        base.update({"kind": slot_obj._slot, "bonus_defense": getattr(slot_obj, "bonus_defense", 0)})
-    elif isinstance(slot_obj, Artifact):
-        spm = slot_obj.stat_percent_mod()
-        base.update({"kind": slot_obj._slot, "atk_pct": spm.attack_pct, "def_pct": spm.defense_pct, "lck_pct": spm.luck_pct})
+    enc = _EQ_ENCODERS.get(type(slot_obj))
+    if enc is None:
+        base["kind"] = "unknown"
     else:
-        base.update({"kind": "unknown"})
+        enc(slot_obj, base)
     return base
 
+def _dec_weapon(name: str, dmax: int, d: dict) -> Weapon:
+    return Weapon(name=name, durability_max=dmax, bonus_attack=int(d.get("bonus_attack", 0)))
+
+def _dec_armor(name: str, dmax: int, d: dict) -> Armor:
+    return Armor(name=name, durability_max=dmax, bonus_defense=int(d.get("bonus_defense", 0)))
+
+def _dec_artifact(name: str, dmax: int, d: dict) -> Artifact:
+    return Artifact(
+        name=name,
+        durability_max=dmax,
+        atk_pct=float(d.get("atk_pct", 0.0)),
+        def_pct=float(d.get("def_pct", 0.0)),
+        lck_pct=float(d.get("lck_pct", 0.0))
+        )
+
+# "kind" sauvegardé -> constructeur
+_EQ_DECODERS = {"weapon": _dec_weapon, "armor": _dec_armor, "artifact": _dec_artifact}
+
 def _equipment_slot_from_dict(d: dict | None):
     if not d:
         return None
-    k = d.get("kind")
-    name = d.get("name", "???")
-    dur = d.get("durability", {"current": 1, "maximum": 1})
-    if k == "weapon":
-        bonus = int(d.get("bonus_attack", 0))
-        obj = Weapon(
-            name=name, 
-            durability_max=int(dur.get("maximum", 1)), 
-            bonus_attack=bonus
-            )
-    elif k == "armor":
-        obj = Armor(
-            name=name, 
-            durability_max=int(dur.get("maximum", 1)), 
-            bonus_defense=int(d.get("bonus_defense", 0))
-            )
-    elif k == "artifact":
-        obj = Artifact(
-            name=name, 
-            durability_max=int(dur.get("maximum", 1)),
-            atk_pct=float(d.get("atk_pct", 0.0)), 
-            def_pct=float(d.get("def_pct", 0.0)),
-            lck_pct=float(d.get("lck_pct", 0.0))
-            )
-    else:
+    dec = _EQ_DECODERS.get(d.get("kind"))
+    if dec is None:
         return None
+    dur = d.get("durability", {"current": 1, "maximum": 1})
+    obj = dec(d.get("name", "???"), int(dur.get("maximum", 1)), d)
     # positionner la durabilité courante
     obj.durability.current = int(dur.get("current", obj.durability.maximum))
     return obj
@@ -207,8 +232,8 @@ def game_to_dict0(loop: GameLoop) -> dict:
     except Exception:
         # Fallback minimaliste si list_summary() n'est pas dispo
         stacks = getattr(inv, "_stacks", {}) or {}
-        for item_id, lst in stacks.items():
-            total = sum(int(getattr(s, "qty", 0)) for s in lst)
+        for item_id, group in stacks.items():
+            total = sum(group.qtys)
             if total > 0:
                 inv_rows.append({"item_id": str(item_id), "qty": total})
 
@@ -232,15 +257,7 @@ def game_to_dict0(loop: GameLoop) -> dict:
     # RNG — optionnel: on ne sérialise pas l'état Python interne par défaut
     rng_state = None
     try:
-        st = loop.rng.getstate()
-        # transformer tuple imbriqué en listes pour JSON
-        def _to_jsonable(x):
-            if isinstance(x, tuple):
-                return [_to_jsonable(y) for y in x]
-            if isinstance(x, (list, int, str)):
-                return x
-            return str(x)
-        rng_state = _to_jsonable(st)
+        rng_state = _rng_state_to_json(loop.rng.getstate())
     except Exception:
         rng_state = None
 
@@ -263,10 +280,6 @@ def game_to_dict(game: GameLoop) -> dict:
     # Imports locaux pour éviter les cycles au chargement du module
     from core.equipment import Weapon, Armor, Artifact
 
-    def _res_to_dict(res) -> dict:
-        return {"current": int(getattr(res, "current", 0)),
-                "maximum": int(getattr(res, "maximum", 0))}
-
     def _stats_to_dict(stats) -> dict:
         return {
             "attack": int(getattr(stats, "attack", 0)),
@@ -306,13 +319,13 @@ def game_to_dict(game: GameLoop) -> dict:
         # Items stackables (total par item_id)
         items_rows = []
         stacks = getattr(inv, "_stacks", {}) or {}
-        for item_id, lst in stacks.items():
-            total = sum(int(getattr(st, "qty", 0)) for st in lst)
+        for item_id, group in stacks.items():
+            total = sum(group.qtys)
             if total > 0:
                 items_rows.append({"item_id": str(item_id), "qty": int(total)})
         # Équipements non stackables
         equips_rows = []
-        for eq in list(getattr(inv, "_equipment", []) or []):
+        for eq in list((getattr(inv, "_equipment", None) or {}).values()):
             equips_rows.append(_equip_slot_to_dict(eq))
         return {"items": items_rows, "equipment": equips_rows, "capacity": int(getattr(inv, "capacity", 0))}
 
@@ -337,8 +350,8 @@ def game_to_dict(game: GameLoop) -> dict:
             "name": getattr(p, "name", "Héros"),
             "class_key": getattr(p, "player_class_key", "guerrier"),
             "base_stats": _stats_to_dict(getattr(p, "base_stats", None)),
-            "hp": _res_to_dict(getattr(p, "hp_res", None)),
-            "sp": _res_to_dict(getattr(p, "sp_res", None)),
+            "hp": {"current": int(p.hp), "maximum": int(p.max_hp)},
+            "sp": {"current": int(p.sp), "maximum": int(p.max_sp)},
         },
         "wallet": {"gold": int(getattr(getattr(game, "wallet", None), "gold", 0))},
         "zone": {
@@ -388,8 +401,8 @@ def dict_to_game0(data: dict, *, io=None):
     player = Player(name=name, player_class_key=class_key, base_stats=base_stats, base_hp_max=base_hp_max, base_sp_max=base_sp_max)
     # Rétablir les valeurs courantes hp/sp
     # (on suppose que Entity expose hp/sp en propriété directe)
-    player.hp_res.current = int(p["hp"]["current"])
-    player.sp_res.current = int(p["sp"]["current"])
+    player.hp = max(0, min(int(p["hp"]["current"]), player.max_hp))
+    player.sp = max(0, min(int(p["sp"]["current"]), player.max_sp))
 
     # Boucle et systèmes
     loop = GameLoop(player=player, io=io, seed=None)
@@ -444,11 +457,7 @@ def dict_to_game0(data: dict, *, io=None):
     # RNG (facultatif)
     try:
         if data.get("rng_state"):
-            def _to_tuple(x):
-                if isinstance(x, list):
-                    return tuple(_to_tuple(y) for y in x)
-                return x
-            loop.rng.setstate(_to_tuple(data["rng_state"]))
+            loop.rng.setstate(_rng_state_from_json(data["rng_state"]))
     except Exception:
         pass
 
@@ -461,14 +470,10 @@ def dict_to_game(data: dict, *, io=None):
     # Imports locaux pour éviter les cycles
     from core.stats import Stats
     from core.player import Player
-    from core.resource import Resource
     from core.equipment import Weapon, Armor, Artifact
     from core.equipment_set import EquipmentSet
     from core.loadout import Loadout
     from game.game_loop import GameLoop, ZoneType
-    import inspect
-    from core import effects as _effects_mod
-    from core.effects import Effect as _BaseEffect
 
     def _zone_from_name(name: str | None):
         if not name:
@@ -480,12 +485,12 @@ def dict_to_game(data: dict, *, io=None):
 
     def _res_apply(entity, res_name: str, row: dict):
         # Fixe maximum puis current (sans préserver le ratio)
-        res: Resource = getattr(entity, f"{res_name}_res")
         if isinstance(row, dict):
-            mx = int(row.get("maximum", getattr(res, "maximum", 0)))
-            cur = int(row.get("current", getattr(res, "current", 0)))
-            res.set_maximum(mx, preserve_ratio=False)
-            res.current = max(0, min(cur, res.maximum))
+            max_attr = f"max_{res_name}"
+            mx = int(row.get("maximum", getattr(entity, max_attr, 0)))
+            cur = int(row.get("current", getattr(entity, res_name, 0)))
+            getattr(entity, f"set_{max_attr}")(mx, preserve_ratio=False)
+            setattr(entity, res_name, max(0, min(cur, getattr(entity, max_attr))))
 
     def _stats_from_dict(d: dict) -> Stats:
         d = d or {}
@@ -608,13 +613,8 @@ def dict_to_game(data: dict, *, io=None):
         pass
 
     # ---------- Effects ----------
-    # Registre auto à partir de core.effects (cls_name -> classe)
+    # Registre de core.effects (cls_name -> constructeur)
     try:
-        _EFFECT_REGISTRY = {
-            name: cls
-            for name, cls in inspect.getmembers(_effects_mod, inspect.isclass)
-            if issubclass(cls, _BaseEffect)
-        }
         loop.effects.restore(loop.player, data.get("effects", []) or [], registry=_EFFECT_REGISTRY, ctx=None)
     except Exception:
         pass
@@ -654,8 +654,8 @@ def dict_to_game(data: dict, *, io=None):
 def save_to_file(loop, path: str) -> bool:
     try:
         payload = game_to_dict(loop)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        with open(path, "wb") as f:
+            f.write(_dumps(payload))
         return True
     except Exception:
         return False
@@ -663,8 +663,8 @@ def save_to_file(loop, path: str) -> bool:
 
 def load_from_file(path: str, *, io=None):
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(path, "rb") as f:
+            data = _loads(f.read())
         return dict_to_game(data, io=io)
     except Exception:
         return None
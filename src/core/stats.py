@@ -1,10 +1,11 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Stats:
     """
-        Stats fixe (attaque, défense, chance, multiplicateur crit)
+        Stats fixe (attaque, défense, chance, multiplicateur crit) — immuable.
+        Les bonus remplacent entity.base_stats par une nouvelle valeur (cf. with_delta).
         args: attack, defense, luck, crit_multplier
     """
     attack: int = 0
@@ -28,6 +29,10 @@ class Stats:
             self.crit_multiplier,  # on ne “soustrait” pas un crit mult
         )
 
+    def with_delta(self, attack: int = 0, defense: int = 0, luck: int = 0) -> Stats:
+        """Copie décalée de plats (crit inchangé)."""
+        return Stats(self.attack + attack, self.defense + defense, self.luck + luck, self.crit_multiplier)
+
     def scaled(self, pct: float) -> Stats:
         return Stats(
             int(round(self.attack * pct)),
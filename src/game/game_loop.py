@@ -366,6 +366,7 @@ class GameLoop:
             self._tick_end_of_turn(attacker=enemy, defender=self.player)
 
         # fin du combat
+        self.effects.drop(enemy)
         victory = (self.player.hp > 0 and enemy.hp <= 0)
         if victory:
             g = self._gold_reward_for(enemy, is_boss=getattr(enemy, "is_boss", False))
@@ -419,13 +420,13 @@ class GameLoop:
         return ("attack", atks[0] if atks else Attack(name="Attaque", base_damage=5, variance=2, cost=0))
 
     def _select_enemy_attack(self, enemy: Enemy) -> Attack:
-        atks = list(enemy.attacks or [])
+        atks = enemy.attacks
         if not atks:
             return Attack(name="Coup maladroit", base_damage=4, variance=2, cost=0)
-        ai = enemy.behavior_ai
-        if ai is not None:
+        choose = enemy.choose_attack
+        if choose is not None:
             try:
-                return ai.choose(enemy=enemy, player=self.player, attacks=atks, rng=self.rng)
+                return choose(enemy=enemy, player=self.player, attacks=atks, rng=self.rng)
             except Exception:
                 pass
         # Fallback au cas où (aléatoire pondéré)